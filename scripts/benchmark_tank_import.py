@@ -17,10 +17,8 @@ def _build_rows(total: int, unique: int) -> list[tuple[str, int, str]]:
     types = ("light", "medium", "heavy", "td")
     unique = max(1, min(unique, total))
     base = [(f"Tank-{i:05d}", (i % 10) + 1, types[i % 4]) for i in range(unique)]
-    rows: list[tuple[str, int, str]] = []
-    for i in range(total):
-        rows.append(base[i % unique])
-    return rows
+    q, r = divmod(total, unique)
+    return base * q + base[:r]
 
 
 async def _benchmark_legacy(db_path: str, rows: list[tuple[str, int, str]]) -> tuple[int, int, float]:
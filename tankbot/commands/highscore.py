@@ -1,8 +1,14 @@
-import discord, csv, io
+import asyncio
+import discord
 from discord import app_commands
 from datetime import datetime, timezone
 import difflib
+from functools import lru_cache
 import logging
+import re
+import sys
+import threading
+import time
 from .. import config, db, utils, forum_index, static_site, audit_channel, wg_sync
 
 grp = app_commands.Group(name="highscore", description="Highscore commands")
@@ -18,10 +24,32 @@ async def _refresh_webpage_notice(*, context: str) -> str:
         return "ℹ️ Static webpage generation is disabled."
     return f"🌐 Static webpage updated: `{page_path}`"
 
+def _queue_webpage_notice() -> str:
+    # Page generation runs in the background so replies are not held up by it.
+    if not static_site.schedule_leaderboard_page():
+        return "ℹ️ Static webpage generation is disabled."
+    return "🌐 Static webpage update queued."
+
+_ISO8601_UTC_Z_RE = re.compile(r"(\d{4})-(\d\d)-(\d\d)T(\d\d):(\d\d):(\d\d)(?:\.(\d{1,6}))?Z", re.ASCII)
+
+@lru_cache(maxsize=4096)
 def _parse_iso8601(s: str) -> str | None:
     s = (s or "").strip()
     if not s:
         return None
+    # Already UTC ("YYYY-MM-DDTHH:MM:SS[.ffffff]Z"): validate the fields and
+    # only normalize the fraction the way isoformat() would.
+    m = _ISO8601_UTC_Z_RE.fullmatch(s)
+    if m:
+        *fields, frac = m.groups()
+        micros = int(frac.ljust(6, "0")) if frac else 0
+        try:
+            datetime(*map(int, fields), micros)
+        except ValueError:
+            return None
+        if not frac:
+            return s
+        return f"{s[:19]}.{micros:06d}Z" if micros else f"{s[:19]}Z"
     # Accept "Z"
     if s.endswith("Z"):
         s = s[:-1] + "+00:00"
@@ -67,17 +95,21 @@ async def _resolve_player_for_storage(player_input: str) -> tuple[str, str, str
     suggestions = await db.suggest_player_names(player_raw, limit=3)
     return canonical, player_norm, normalized_note, suggestions
 
-async def _resolve_tank_for_storage(tank_input: str) -> tuple[tuple[str, int, str] | None, list[str]]:
+async def _resolve_tank_and_best_for_storage(
+    tank_input: str,
+) -> tuple[tuple[str, int, str] | None, list[str], tuple | None]:
     tank_raw = utils.validate_text("Tank", tank_input, 64)
-    canonical = await db.get_tank_canonical(tank_raw)
+    canonical, best = await db.get_tank_and_best(tank_raw)
     if canonical:
-        return canonical, []
+        return canonical, [], best
     suggestions = await db.suggest_tank_names(tank_raw, limit=3)
-    return None, suggestions
+    return None, suggestions, None
 
 def _format_audit_score(value: int | None) -> str:
     if value is None:
         return "-"
+    if type(value) is int:  # what the DB hands back; skip the coercion
+        return str(value) if value > 0 else "-"
     try:
         iv = int(value)
     except Exception:
@@ -106,6 +138,49 @@ def _format_name_block(title: str, names: list[str], *, max_names: int = 20) ->
         text += f", ... (+{len(names) - max_names} more)"
     return f"{title}: **{len(names)}**\n{text}"
 
+# /history section order by tank type.
+_HISTORY_TYPE_RANK = {"heavy": 0, "medium": 1, "light": 2, "td": 3}
+
+# Roster lookups for import_scores, reused until the roster or aliases change.
+_TANK_INDEX_CACHE: tuple | None = None
+# The cached fuzzy matchers are stateful (set_seq1) and imports validate in
+# worker threads, so concurrent imports take turns on them.
+_FUZZY_MATCH_LOCK = threading.Lock()
+
+async def _get_tank_index():
+    global _TANK_INDEX_CACHE
+    key = (config.DB_PATH, db.name_cache_generation())
+    if _TANK_INDEX_CACHE is not None and _TANK_INDEX_CACHE[0] == key:
+        return _TANK_INDEX_CACHE[1]
+
+    norm_tank_name = utils.norm_tank_name
+    all_tanks: list[tuple[str, int, str]] = [
+        (str(name), int(tier), str(ttype)) for name, tier, ttype in await db.list_tanks()
+    ]
+    tank_lookup: dict[str, tuple[str, int, str]] = {
+        sys.intern(norm_tank_name(t[0])): t for t in all_tanks
+    }
+    loose_keys = [utils.loose_tank_key(t[0]) for t in all_tanks]
+    tank_lookup_loose: dict[str, list[tuple[str, int, str]]] = {}
+    for canonical, loose in zip(all_tanks, loose_keys):
+        tank_lookup_loose.setdefault(loose, []).append(canonical)
+    alias_lookup: dict[str, tuple[str, int, str]] = {}
+    for alias_raw, tank_name, _created in await db.list_tank_aliases(limit=500):
+        t = tank_lookup.get(norm_tank_name(tank_name))
+        if t:
+            alias_lookup[sys.intern(norm_tank_name(alias_raw))] = t
+    # SequenceMatcher caches its analysis of seq2, so keep one matcher per
+    # roster tank and only swap in the CSV value for each comparison.
+    fuzzy_matchers = [
+        (difflib.SequenceMatcher(None, "", loose), canonical)
+        for canonical, loose in zip(all_tanks, loose_keys)
+    ]
+    index = (all_tanks, tank_lookup, tank_lookup_loose, loose_keys, alias_lookup, fuzzy_matchers)
+    # Skip caching if the roster changed while it was being read.
+    if key == (config.DB_PATH, db.name_cache_generation()):
+        _TANK_INDEX_CACHE = (key, index)
+    return index
+
 @grp.command(name="import_scores", description="Import historical scores from CSV (admins only)")
 @app_commands.describe(
     file="CSV file",
@@ -124,48 +199,50 @@ async def import_scores(
     if not isinstance(member, discord.Member) or not utils.can_manage(member):
         await interaction.response.send_message("Nope. You need **Manage Server**.", ephemeral=True)
         return
+    # An apply without confirmation would be thrown away after parsing; say so
+    # before downloading anything. (Use dry_run=true for a validation report.)
+    if not dry_run and (confirm or "").strip().upper() != "YES":
+        await interaction.response.send_message(
+            f"❌ To apply, set `confirm` to **YES**. (you sent: `{confirm}`)",
+            ephemeral=True,
+        )
+        return
 
-    await interaction.response.defer(ephemeral=True)
-    await interaction.followup.send("⏳ Validating CSV…", ephemeral=True)
-    # Read CSV bytes
-    data = await file.read()
-    text = data.decode("utf-8-sig", errors="replace")
-
-    reader = csv.DictReader(io.StringIO(text))
-
-    if not reader.fieldnames:
-        await interaction.followup.send("CSV has no header row.", ephemeral=True)
+    upload_error = utils.csv_upload_error(file.size)
+    if upload_error:
+        await interaction.response.send_message(upload_error, ephemeral=True)
         return
 
-    # Column aliasing (so people don’t brick imports by naming)
-    def get(row, *keys):
-        for k in keys:
-            if k in row and row[k] is not None:
-                return row[k]
-        return ""
+    await interaction.response.defer(ephemeral=True)
+    # One status message, edited in place as the import advances.
+    progress = await interaction.followup.send("⏳ Validating CSV…", ephemeral=True, wait=True)
+    upload = utils.CsvUpload(await file.read())
+    if not upload.header:
+        await progress.edit(content="CSV has no header row.")
+        return
 
+    # Column aliasing (so people don’t brick imports by naming), resolved once.
+    tank_col = upload.column("tank_name", "tank")
+    score_col = upload.column("score")
+    player_col = upload.column("player_name", "player")
+    created_col = upload.column("created_at", "timestamp", "date")
+    submitted_by_col = upload.column("submitted_by")
+
+    # Only the first errors / auto-mappings are shown, so only those are kept;
+    # the rest are just counted.
+    max_shown_errors = 15
+    max_shown_auto_mapped = 10
     errors: list[str] = []
+    error_count = 0
     inserts: list[tuple[str, str, str, int, str, str]] = []
-    touched_buckets: set[tuple[int, str]] = set()
-    tank_lookup: dict[str, tuple[str, int, str]] = {}
-    tank_lookup_loose: dict[str, list[tuple[str, int, str]]] = {}
-    all_tanks: list[tuple[str, int, str]] = []
-    for name, tier, ttype in await db.list_tanks():
-        canonical = (str(name), int(tier), str(ttype))
-        all_tanks.append(canonical)
-        tank_lookup[utils.norm_tank_name(str(name))] = canonical
-        loose = utils.loose_tank_key(str(name))
-        tank_lookup_loose.setdefault(loose, []).append(canonical)
-    alias_lookup: dict[str, tuple[str, int, str]] = {}
-    for alias_raw, tank_name, _created in await db.list_tank_aliases(limit=500):
-        t = tank_lookup.get(utils.norm_tank_name(tank_name))
-        if t:
-            alias_lookup[utils.norm_tank_name(alias_raw)] = t
+    norm_tank_name = utils.norm_tank_name
+    all_tanks, tank_lookup, tank_lookup_loose, loose_keys, alias_lookup, fuzzy_matchers = await _get_tank_index()
     auto_mapped: list[tuple[int, str, str, str]] = []
+    auto_mapped_count = 0
 
     def resolve_tank_row(tank_in: str) -> tuple[tuple[str, int, str] | None, str | None]:
         # 1) strict normalized key
-        n = utils.norm_tank_name(tank_in)
+        n = norm_tank_name(tank_in)
         t = tank_lookup.get(n)
         if t:
             return t, None
@@ -193,7 +270,7 @@ async def import_scores(
         }
         alias_target = alias_targets.get(lk)
         if alias_target:
-            alias_key = utils.norm_tank_name(alias_target)
+            alias_key = norm_tank_name(alias_target)
             t = tank_lookup.get(alias_key)
             if t:
                 return t, "alias"
@@ -201,25 +278,34 @@ async def import_scores(
         # 3) containment on loose keys (handles shortened forms like "Ru 251")
         contain_hits = []
         if len(lk) >= 5:
-            for n2, t2, ty2 in all_tanks:
-                l2 = utils.loose_tank_key(n2)
-                if lk in l2 and len(l2) >= len(lk):
-                    contain_hits.append((n2, t2, ty2))
+            for canonical, l2 in zip(all_tanks, loose_keys):
+                if lk in l2:
+                    contain_hits.append(canonical)
         if len(contain_hits) == 1:
             return contain_hits[0], "loose-contains"
 
         # 4) conservative fuzzy fallback by loose key
-        ranked = []
-        for n2, t2, ty2 in all_tanks:
-            score = difflib.SequenceMatcher(None, lk, utils.loose_tank_key(n2)).ratio()
-            ranked.append((score, (n2, t2, ty2)))
-        ranked.sort(key=lambda x: x[0], reverse=True)
-        if ranked:
-            best_score, best_tank = ranked[0]
-            second_score = ranked[1][0] if len(ranked) > 1 else 0.0
-            # high confidence + separation from second best
-            if best_score >= 0.90 and (best_score - second_score) >= 0.04:
-                return best_tank, f"fuzzy:{best_score:.2f}"
+        # Keys under 5 chars can only reach 0.90 against an identical key, and
+        # identical keys were settled in step 2 (unique hit) or are ambiguous
+        # (two 1.0 scores never pass the margin) - skip the scan in both cases.
+        if len(lk) < 5 or len(loose_hits) > 1:
+            return None, None
+        best_score = second_score = 0.0
+        best_tank = None
+        with _FUZZY_MATCH_LOCK:
+            for sm, cand in fuzzy_matchers:
+                sm.set_seq1(lk)
+                # Upper bounds first: skip candidates that cannot enter the top two.
+                if sm.real_quick_ratio() <= second_score or sm.quick_ratio() <= second_score:
+                    continue
+                score = sm.ratio()
+                if score > best_score:
+                    second_score, best_score, best_tank = best_score, score, cand
+                elif score > second_score:
+                    second_score = score
+        # high confidence + separation from second best
+        if best_tank and best_score >= 0.90 and (best_score - second_score) >= 0.04:
+            return best_tank, f"fuzzy:{best_score:.2f}"
 
         return None, None
 
@@ -227,87 +313,137 @@ async def import_scores(
     now = utils.utc_now_z()
     canonical_players = await db.canonical_player_name_map()
 
-    for i, row in enumerate(reader, start=2):  # line numbers: header is 1
-        tank_in = get(row, "tank_name", "tank").strip()
-        score_in = get(row, "score").strip()
-        player_in = get(row, "player_name", "player").strip()
-        created_in = get(row, "created_at", "timestamp", "date").strip()
-        submitted_by = get(row, "submitted_by").strip() or submitted_by_default
+    # Bind per-row lookups once; the loop below runs up to 5000 times.
+    max_score = config.MAX_SCORE
+    validate_text = utils.validate_text
+    normalize_player = utils.normalize_player
+    intern = sys.intern
+
+    def add_error(message: str):
+        nonlocal error_count
+        if error_count < max_shown_errors:
+            errors.append(message)
+        error_count += 1
+
+    add_insert = inserts.append
+
+    # CSVs repeat the same tank spelling many times; resolve each once.
+    # Raw tank cell -> (tank, auto-map method, (tier, type) bucket key).
+    resolved_tanks: dict[str, tuple[tuple[str, int, str] | None, str | None, tuple[int, str] | None]] = {}
+    # Unknown-tank errors get their suggestions in one batch after the loop:
+    # (index in errors, line number, raw tank value).
+    unknown_tank_errors: list[tuple[int, int, str]] = []
+    # Raw player cell -> (canonical name, normalized key); stable for the import.
+    resolved_players: dict[str, tuple[str, str]] = {}
+    # Players not yet in the DB: first spelling seen in this file wins, kept
+    # apart so the (read-only) canonical map is never written in the loop.
+    new_players: dict[str, str] = {}
+
+    def parse_rows() -> int:
+        # Runs in a worker thread (see below); it only touches this import's
+        # own state, plus the shared fuzzy matchers under their lock.
+        nonlocal auto_mapped_count
+        for i, row in upload.rows():  # line numbers: header is 1
+            tank_in = row[tank_col].strip()
+            score_in = row[score_col].strip()
+            player_in = row[player_col].strip()
+            created_in = row[created_col].strip()
+            submitted_by = row[submitted_by_col].strip() or submitted_by_default
         
-        if not tank_in or not score_in or not player_in:
-            errors.append(f"Line {i}: missing tank_name/score/player_name")
-            continue
-
-        try:
-            score = int(score_in)
-        except Exception:
-            errors.append(f"Line {i}: invalid score '{score_in}'")
-            continue
-
-        if not (1 <= score <= config.MAX_SCORE):
-            errors.append(f"Line {i}: score out of range (1..{config.MAX_SCORE}): {score}")
-            continue
-
-        # Resolve tank (case-insensitive) + bucket info
-        t, method = resolve_tank_row(tank_in)
-        if not t:
-            suggestions = await db.suggest_tank_names(tank_in, limit=3)
-            msg = f"Line {i}: unknown tank '{tank_in}'"
+            if not tank_in or not score_in or not player_in:
+                add_error(f"Line {i}: missing tank_name/score/player_name")
+                continue
+
+            try:
+                score = int(score_in)
+            except Exception:
+                add_error(f"Line {i}: invalid score '{score_in}'")
+                continue
+
+            if not (1 <= score <= max_score):
+                add_error(f"Line {i}: score out of range (1..{max_score}): {score}")
+                continue
+
+            # Resolve tank (case-insensitive) + bucket info
+            hit = resolved_tanks.get(tank_in)
+            if hit is None:
+                t, method = resolve_tank_row(tank_in)
+                hit = resolved_tanks[tank_in] = (t, method, (t[1], t[2]) if t else None)
+            t, method, _bucket = hit
+            if not t:
+                if error_count < max_shown_errors:
+                    unknown_tank_errors.append((len(errors), i, tank_in))
+                add_error(f"Line {i}: unknown tank '{tank_in}'")
+                continue
+            if method:
+                auto_mapped_count += 1
+                if auto_mapped_count <= max_shown_auto_mapped:
+                    auto_mapped.append((i, tank_in, t[0], method))
+
+            tank_name = t[0]
+
+            player = resolved_players.get(player_in)
+            if player is None:
+                player_raw = validate_text("Player", player_in, 64)
+                player_norm = intern(normalize_player(player_raw))
+                canonical_player = canonical_players.get(player_norm) or new_players.setdefault(player_norm, player_raw)
+                player = resolved_players[player_in] = (canonical_player, player_norm)
+            canonical_player, player_norm = player
+
+            created_at = _parse_iso8601(created_in) or now
+            add_insert((canonical_player, player_norm, tank_name, score, submitted_by, created_at))
+
+            # Safety: don’t allow insane imports by accident
+            if len(inserts) > 5000:
+                add_error("Import aborted: >5000 valid rows (safety limit). Split your CSV.")
+                break
+        return upload.line_num
+
+    # Decoding and validating thousands of rows is CPU-bound; keep it off the
+    # event loop so the gateway heartbeat and other commands are not stalled.
+    parsed_lines = await asyncio.to_thread(parse_rows)
+
+    # A spelling is only resolved once its row has passed the score checks,
+    # and every row past resolution is inserted, so the buckets touched by
+    # the import are exactly those of the resolved spellings.
+    touched_buckets = {bucket for _t, _method, bucket in resolved_tanks.values() if bucket}
+
+    if unknown_tank_errors:
+        suggestions_by_tank = await db.suggest_tank_names_batch(
+            {tank_in for _pos, _line, tank_in in unknown_tank_errors}, limit=3
+        )
+        for pos, line, tank_in in unknown_tank_errors:
+            suggestions = suggestions_by_tank.get(tank_in)
             if suggestions:
-                msg += " (did you mean: " + ", ".join(suggestions) + ")"
-            errors.append(msg)
-            continue
-        if method:
-            auto_mapped.append((i, tank_in, t[0], method))
-
-        tank_name, tier, ttype = t
-
-        player_raw = utils.validate_text("Player", player_in, 64)
-        player_norm = utils.normalize_player(player_raw)
-        canonical_player = canonical_players.get(player_norm, player_raw)
-        canonical_players.setdefault(player_norm, canonical_player)
-
-        created_at = _parse_iso8601(created_in) or now
-        inserts.append((canonical_player, player_norm, tank_name, score, submitted_by, created_at))
-        touched_buckets.add((int(tier), str(ttype)))
-
-        # Safety: don’t allow insane imports by accident
-        if len(inserts) > 5000:
-            errors.append("Import aborted: >5000 valid rows (safety limit). Split your CSV.")
-            break
+                errors[pos] = f"Line {line}: unknown tank '{tank_in}' (did you mean: " + ", ".join(suggestions) + ")"
 
     # Report validation summary first
     msg_lines = []
-    msg_lines.append(f"Parsed: **{reader.line_num}** lines")
+    msg_lines.append(f"Parsed: **{parsed_lines}** lines")
     msg_lines.append(f"Valid rows: **{len(inserts)}**")
-    msg_lines.append(f"Errors: **{len(errors)}**")
-    msg_lines.append(f"Auto-mapped tanks: **{len(auto_mapped)}**")
+    msg_lines.append(f"Errors: **{error_count}**")
+    msg_lines.append(f"Auto-mapped tanks: **{auto_mapped_count}**")
     msg_lines.append(f"Dry-run: **{dry_run}**")
 
     if errors:
         # Don’t spam; show first 15
         msg_lines.append("")
         msg_lines.append("First errors:")
-        for e in errors[:15]:
+        for e in errors:
             msg_lines.append(f"- {e}")
-        if len(errors) > 15:
-            msg_lines.append(f"- ...and {len(errors) - 15} more")
+        if error_count > len(errors):
+            msg_lines.append(f"- ...and {error_count - len(errors)} more")
     if auto_mapped:
         msg_lines.append("")
         msg_lines.append("Auto-mapped tank names:")
-        for ln, src, dst, method in auto_mapped[:10]:
+        for ln, src, dst, method in auto_mapped:
             msg_lines.append(f"- Line {ln}: `{src}` -> **{dst}** ({method})")
-        if len(auto_mapped) > 10:
-            msg_lines.append(f"- ...and {len(auto_mapped) - 10} more")
+        if auto_mapped_count > len(auto_mapped):
+            msg_lines.append(f"- ...and {auto_mapped_count - len(auto_mapped)} more")
 
     if dry_run:
-        await interaction.followup.send("\n".join(msg_lines), ephemeral=True)
+        await progress.edit(content="\n".join(msg_lines))
         return
-    confirm_norm = (confirm or "").strip().upper()
-
-    if confirm_norm != "YES":
-        await interaction.followup.send("\n".join(msg_lines + ["", f"❌ To apply, set `confirm` to **YES**. (you sent: `{confirm}`)"]),ephemeral=True,)
-        return  
 
     msg_lines.append("")
     
@@ -315,26 +451,48 @@ async def import_scores(
     if not inserts:
         msg_lines.append("")
         msg_lines.append("⚠️ Nothing to import (0 valid rows). No changes were made.")
-        await interaction.followup.send("\n".join(msg_lines), ephemeral=True)
+        await progress.edit(content="\n".join(msg_lines))
         return
 
-    await interaction.followup.send(f"⏳ Applying **{len(inserts)}** rows to the database…", ephemeral=True)
-    applied = await db.insert_submissions_bulk(inserts)
+    await progress.edit(content=f"⏳ Applying **{len(inserts)}** rows to the database…")
+    last_progress = time.monotonic()
+
+    async def report_rows(done: int, total: int):
+        # Throttled like the bucket progress below.
+        nonlocal last_progress
+        now_m = time.monotonic()
+        if done >= total or now_m - last_progress < 2.0:
+            return
+        last_progress = now_m
+        await progress.edit(content=f"⏳ Applied **{done}/{total}** rows to the database…")
+
+    applied = await db.insert_submissions_bulk(inserts, on_progress=report_rows)
 
     # Targeted updates only (after insert), optionally skipped for speed.
     if update_index:
         if touched_buckets:
-            await interaction.followup.send(
-                f"⏳ Updating **{len(touched_buckets)}** leaderboard buckets…",
-                ephemeral=True,
+            await progress.edit(
+                content=f"⏳ Updating **{len(touched_buckets)}** leaderboard buckets…",
             )
-        for tier, ttype in touched_buckets:
-            await forum_index.targeted_update(interaction.client, int(tier), str(ttype))
+        last_progress = time.monotonic()
+
+        async def report_buckets(done: int, total: int):
+            # Throttled: at most one status edit every 2s, none for the last bucket.
+            nonlocal last_progress
+            now_m = time.monotonic()
+            if done >= total or now_m - last_progress < 2.0:
+                return
+            last_progress = now_m
+            await progress.edit(content=f"⏳ Updated **{done}/{total}** leaderboard buckets…")
+
+        await forum_index.targeted_update_many(
+            interaction.client, touched_buckets, on_progress=report_buckets
+        )
     else:
         msg_lines.append("⚠️ Skipped leaderboard thread updates (`update_index=false`).")
         msg_lines.append("Run `/tank rebuild_index` after import to refresh snapshots.")
 
-    msg_lines.append(await _refresh_webpage_notice(context="Import applied, but"))
+    msg_lines.append(_queue_webpage_notice())
 
     msg_lines.append("")
     msg_lines.append(
@@ -353,7 +511,7 @@ async def import_scores(
             f"ignored={applied['ignored']}"
         ),
     )
-    await interaction.followup.send("\n".join(msg_lines), ephemeral=True)
+    await progress.edit(content="\n".join(msg_lines))
 
 @grp.command(name="submit", description="Submit a new highscore (commanders only)")
 @app_commands.describe(player="Player name", tank="Tank name", score="Damage (1..100000)")
@@ -365,17 +523,28 @@ async def submit(interaction: discord.Interaction, player: str, tank: str, score
     if not (1 <= score <= config.MAX_SCORE):
         await interaction.response.send_message(f"Damage must be between 1 and {config.MAX_SCORE}.", ephemeral=True)
         return
-    t, tank_suggestions = await _resolve_tank_for_storage(tank)
+
+    # Player resolution is independent of the tank, so overlap the two; the
+    # tank result is checked first so its errors keep precedence over a
+    # player validation error.
+    tank_result, player_result = await asyncio.gather(
+        _resolve_tank_and_best_for_storage(tank),
+        _resolve_player_for_storage(player),
+        return_exceptions=True,
+    )
+    if isinstance(tank_result, BaseException):
+        raise tank_result
+    t, tank_suggestions, best = tank_result
     if not t:
         msg = "Unknown tank. Use an existing tank from the roster."
         if tank_suggestions:
             msg += "\nDid you mean: " + ", ".join([f"**{s}**" for s in tank_suggestions])
         await interaction.response.send_message(msg, ephemeral=True)
         return
-
-    player_raw, player_norm, normalized_note, suggestions = await _resolve_player_for_storage(player)
+    if isinstance(player_result, BaseException):
+        raise player_result
+    player_raw, player_norm, normalized_note, suggestions = player_result
     tank_name, tier, ttype = t  # canonical casing + bucket info
-    best = await db.get_best_for_tank(tank_name)
     qualifies, gate_msg = _highscore_gate_message(tank_name, score, best)
     if not qualifies:
         await interaction.response.send_message(f"❌ Not submitted. {gate_msg[2:]}", ephemeral=True)
@@ -397,19 +566,22 @@ async def submit(interaction: discord.Interaction, player: str, tank: str, score
             ephemeral=True,
         )
         return
-    # Update only the relevant bucket thread
-    await forum_index.targeted_update(interaction.client, int(tier), str(ttype))
-    await audit_channel.send(
-        interaction.client,
-        (
-            "🧾 [score submit] "
-            f"action={outcome['status']} "
-            f"submission_id={outcome['submission_id']} "
-            f"tank={tank_name} "
-            f"player={player_raw} "
-            f"old={_format_audit_score(outcome['old_score'])} "
-            f"new={_format_audit_score(outcome['new_score'])} "
-            f"actor={interaction.user.display_name}"
+    # Update only the relevant bucket thread; it and the audit post are
+    # independent Discord calls, so send them together.
+    await asyncio.gather(
+        forum_index.targeted_update(interaction.client, int(tier), str(ttype)),
+        audit_channel.send(
+            interaction.client,
+            (
+                "🧾 [score submit] "
+                f"action={outcome['status']} "
+                f"submission_id={outcome['submission_id']} "
+                f"tank={tank_name} "
+                f"player={player_raw} "
+                f"old={_format_audit_score(outcome['old_score'])} "
+                f"new={_format_audit_score(outcome['new_score'])} "
+                f"actor={interaction.user.display_name}"
+            ),
         ),
     )
 
@@ -418,7 +590,7 @@ async def submit(interaction: discord.Interaction, player: str, tank: str, score
         msg += f"\nℹ️ {normalized_note}"
     if suggestions:
         msg += "\n💡 Similar existing names: " + ", ".join([f"**{s}**" for s in suggestions])
-    msg += "\n" + await _refresh_webpage_notice(context="Submission saved, but")
+    msg += "\n" + _queue_webpage_notice()
     await interaction.followup.send(msg, ephemeral=True)
 
 @submit.autocomplete("player")
@@ -487,25 +659,25 @@ async def edit(
         return
 
     tank_name = updated["tank_name"]
-    tank = await db.get_tank_canonical(tank_name)
-    if tank:
-        _tank_name, tier, ttype = tank
-        await forum_index.targeted_update(interaction.client, int(tier), str(ttype))
-    await audit_channel.send(
-        interaction.client,
-        (
-            "🧾 [score edit] "
-            f"submission_id={submission_id} "
-            f"tank={tank_name} "
-            f"player_old={updated['old_player_raw']} "
-            f"player_new={updated['new_player_raw']} "
-            f"old={updated['old_score']} "
-            f"new={updated['new_score']} "
-            f"actor={interaction.user.display_name}"
+    buckets = [(updated["tier"], updated["ttype"])] if updated["tier"] is not None else []
+    await asyncio.gather(
+        forum_index.targeted_update_many(interaction.client, buckets),
+        audit_channel.send(
+            interaction.client,
+            (
+                "🧾 [score edit] "
+                f"submission_id={submission_id} "
+                f"tank={tank_name} "
+                f"player_old={updated['old_player_raw']} "
+                f"player_new={updated['new_player_raw']} "
+                f"old={updated['old_score']} "
+                f"new={updated['new_score']} "
+                f"actor={interaction.user.display_name}"
+            ),
         ),
     )
 
-    notice = await _refresh_webpage_notice(context="Submission edit saved, but")
+    notice = _queue_webpage_notice()
     player_note = ""
     if updated["player_changed"]:
         player_note = (
@@ -560,24 +732,24 @@ async def delete(interaction: discord.Interaction, submission_id: int, hard_dele
         await interaction.followup.send("Submission not found.", ephemeral=True)
         return
 
-    tank = await db.get_tank_canonical(deleted["tank_name"])
-    if tank:
-        _tank_name, tier, ttype = tank
-        await forum_index.targeted_update(interaction.client, int(tier), str(ttype))
-    await audit_channel.send(
-        interaction.client,
-        (
-            "🧾 [score delete] "
-            f"submission_id={submission_id} "
-            f"tank={deleted['tank_name']} "
-            f"old={deleted['old_score']} "
-            f"new={_format_audit_score(deleted['new_score'])} "
-            f"hard_delete={hard_delete} "
-            f"actor={interaction.user.display_name}"
+    buckets = [(deleted["tier"], deleted["ttype"])] if deleted["tier"] is not None else []
+    await asyncio.gather(
+        forum_index.targeted_update_many(interaction.client, buckets),
+        audit_channel.send(
+            interaction.client,
+            (
+                "🧾 [score delete] "
+                f"submission_id={submission_id} "
+                f"tank={deleted['tank_name']} "
+                f"old={deleted['old_score']} "
+                f"new={_format_audit_score(deleted['new_score'])} "
+                f"hard_delete={hard_delete} "
+                f"actor={interaction.user.display_name}"
+            ),
         ),
     )
 
-    notice = await _refresh_webpage_notice(context="Damage deletion saved, but")
+    notice = _queue_webpage_notice()
     if hard_delete:
         msg = (
             f"✅ Hard-deleted submission **#{submission_id}** on **{deleted['tank_name']}** "
@@ -590,6 +762,24 @@ async def delete(interaction: discord.Interaction, submission_id: int, hard_dele
         )
     await interaction.followup.send(msg, ephemeral=True)
 
+def _format_change_line(row) -> str:
+    _id, action, submission_id, tank_name, player_name, old_score, new_score, actor, created, details = row
+    display_player = _format_audit_player(action, player_name, new_score)
+    return (
+        f"- #{_id} **{action}** submission #{submission_id or '-'} "
+        f"**{display_player}** ({tank_name}) "
+        f"`{_format_audit_score(old_score)} -> {_format_audit_score(new_score)}` "
+        f"by **{actor}** • {created}"
+        + (f" • {details}" if details else "")
+    )
+
+_CHANGES_HEADER = "**Damage changes**"
+# Rows past this many can never fit in the 1800-char reply, even if every
+# field is empty, so /highscore changes doesn't fetch them.
+_CHANGES_MAX_ROWS = (1800 - len(_CHANGES_HEADER)) // (
+    len(_format_change_line((0, "", None, "", "", None, None, "", "", None))) + 1
+) + 1
+
 @grp.command(name="changes", description="Show damage audit trail (admin only)")
 @app_commands.describe(limit="How many audit rows (1-50)")
 async def changes(interaction: discord.Interaction, limit: int = 20):
@@ -597,20 +787,19 @@ async def changes(interaction: discord.Interaction, limit: int = 20):
     if not isinstance(member, discord.Member) or not utils.can_manage(member):
         await interaction.response.send_message("Nope. You need **Manage Server**.", ephemeral=True)
         return
-    rows = await db.score_changes(limit=limit)
+    rows = await db.score_changes(limit=min(limit, _CHANGES_MAX_ROWS))
     if not rows:
         await interaction.response.send_message("No damage changes logged.", ephemeral=True)
         return
-    lines = ["**Damage changes**"]
-    for _id, action, submission_id, tank_name, player_name, old_score, new_score, actor, created, details in rows:
-        display_player = _format_audit_player(action, player_name, new_score)
-        lines.append(
-            f"- #{_id} **{action}** submission #{submission_id or '-'} "
-            f"**{display_player}** ({tank_name}) "
-            f"`{_format_audit_score(old_score)} -> {_format_audit_score(new_score)}` "
-            f"by **{actor}** • {created}"
-            + (f" • {details}" if details else "")
-        )
+    lines = [_CHANGES_HEADER]
+    size = len(lines[0])
+    for row in rows:
+        line = _format_change_line(row)
+        lines.append(line)
+        size += len(line) + 1
+        if size > 1800:
+            # Everything past here would be cut by the truncation below.
+            break
     msg = "\n".join(lines)
     if len(msg) > 1800:
         msg = msg[:1800] + "\n…(truncated)"
@@ -624,7 +813,7 @@ async def show(interaction: discord.Interaction, tier: int | None = None, type:
         return
     if type is not None:
         type = type.strip().lower()
-        if type not in ("light","medium","heavy","td"):
+        if type not in utils.TANK_TYPES:
             await interaction.response.send_message("Type must be one of: light, medium, heavy, td.", ephemeral=True)
             return
 
@@ -645,7 +834,10 @@ async def qualify(interaction: discord.Interaction, tank: str, score: int, playe
     if not (1 <= score <= config.MAX_SCORE):
         await interaction.response.send_message(f"Damage must be between 1 and {config.MAX_SCORE}.", ephemeral=True)
         return
-    t, tank_suggestions = await _resolve_tank_for_storage(tank)
+    (t, tank_suggestions, best), champ = await asyncio.gather(
+        _resolve_tank_and_best_for_storage(tank),
+        db.get_champion(),
+    )
     if not t:
         msg = "Unknown tank. Pick an existing tank from the roster."
         if tank_suggestions:
@@ -658,8 +850,6 @@ async def qualify(interaction: discord.Interaction, tank: str, score: int, playe
         player = utils.validate_text('Player', player, 64)
 
     tank_name, tier, ttype = t
-    best = await db.get_best_for_tank(tank_name)
-    champ = await db.get_champion()
 
     lines = []
     lines.append("**Qualification check**")
@@ -714,7 +904,7 @@ async def history(
         return
     if type is not None:
         type = type.strip().lower()
-        if type not in ("light", "medium", "heavy", "td"):
+        if type not in utils.TANK_TYPES:
             await interaction.followup.send("Type must be one of: light, medium, heavy, td.", ephemeral=True)
             return
 
@@ -723,7 +913,10 @@ async def history(
         await interaction.followup.send("No submissions yet.", ephemeral=True)
         return
     await interaction.followup.send("⏳ Building history…", ephemeral=True)
-    champ = await db.get_champion()
+    champ, (tops_tanks, tops_buckets) = await asyncio.gather(
+        db.get_champion(),
+        db.top_holders_combined(limit=5),
+    )
     champ_id = champ[0] if champ else None
 
     grouped: dict[str, dict[int, list[tuple]]] = {}
@@ -731,38 +924,52 @@ async def history(
         _id, player, tank_name, score, submitted_by, created_at, tier, ttype = r
         grouped.setdefault(ttype, {}).setdefault(int(tier), []).append(r)
 
-    type_order = ["heavy", "medium", "light", "td"]
-    types_sorted = [t for t in type_order if t in grouped] + [t for t in grouped.keys() if t not in type_order]
+    # Unknown types sort last, keeping first-seen order (sorted is stable).
+    types_sorted = sorted(grouped, key=lambda t: _HISTORY_TYPE_RANK.get(t, 99))
 
     lines: list[str] = []
+    size = 0  # length of "\n".join(lines); stop once the reply would be truncated anyway
+
+    def emit(line: str) -> bool:
+        nonlocal size
+        size += len(line) + (1 if lines else 0)
+        lines.append(line)
+        return size <= 1800
+
+    entry_fmt = "{}**#{}** — **{}** — **{}** ({}) • Tier {} • {} • {}".format
+    full = False
     for ttype in types_sorted:
-        lines.append(f"## {utils.title_case_type(ttype)}")
+        type_title = utils.title_case_type(ttype)
+        emit(f"## {type_title}")
         for tier in sorted(grouped[ttype].keys(), reverse=True):
-            lines.append(f"**Tier {tier}**")
+            emit(f"**Tier {tier}**")
             for (_id, player, tank_name, score, submitted_by, created_at, _tier, _ttype) in grouped[ttype][tier]:
                 badge = "🏆 **TOP** " if champ_id is not None and _id == champ_id else ""
                 score_text = _format_audit_score(score)
                 player_text = str(player or "").strip() or "-"
                 if score_text == "-":
                     player_text = "-"
-                lines.append(
-                    f"{badge}**#{_id}** — **{score_text}** — **{player_text}** ({tank_name}) "
-                    f"• Tier {_tier} • {utils.title_case_type(_ttype)} • {utils.fmt_utc(created_at)}"
-                )
-            lines.append("")
+                if not emit(entry_fmt(
+                    badge, _id, score_text, player_text, tank_name, _tier, type_title, utils.fmt_utc(created_at)
+                )):
+                    full = True
+                    break
+            if full:
+                break
+            emit("")
+        if full:
+            break
 
-    tops_tanks = await db.top_holders_by_tank(limit=5)
-    tops_buckets = await db.top_holders_by_tier_type(limit=5)
-
-    lines.append("---")
-    lines.append("### 📊 Stats (current #1 holders)")
-    lines.append("**Most #1 tanks:**")
-    for i, (p, cnt) in enumerate(tops_tanks, start=1):
-        lines.append(f"{i}. **{p}** — {cnt} tank tops")
-    lines.append("")
-    lines.append("**Most #1 Tier×Type buckets:**")
-    for i, (p, cnt) in enumerate(tops_buckets, start=1):
-        lines.append(f"{i}. **{p}** — {cnt} bucket tops")
+    if not full:
+        emit("---")
+        emit("### 📊 Stats (current #1 holders)")
+        emit("**Most #1 tanks:**")
+        for i, (p, cnt) in enumerate(tops_tanks, start=1):
+            emit(f"{i}. **{p}** — {cnt} tank tops")
+        emit("")
+        emit("**Most #1 Tier×Type buckets:**")
+        for i, (p, cnt) in enumerate(tops_buckets, start=1):
+            emit(f"{i}. **{p}** — {cnt} bucket tops")
 
     msg = "\n".join(lines).strip()
     if len(msg) > 1800:
@@ -1,9 +1,10 @@
+import asyncio
 import io
 import csv
 import discord
 from discord import app_commands
 
-from .. import db, forum_index, utils, static_site, audit_channel
+from .. import config, db, forum_index, utils, static_site, audit_channel
 
 
 class Tank(app_commands.Group):
@@ -25,12 +26,49 @@ async def _tank_not_found_message(name: str) -> str:
         msg += "\nDid you mean: " + ", ".join([f"**{s}**" for s in suggestions])
     return msg
 
-async def _refresh_webpage():
-    try:
-        await static_site.generate_leaderboard_page()
-    except Exception:
-        # Keep tank operations successful even if page generation fails.
-        return
+def _refresh_webpage():
+    # Queued in the background (failures are logged there), so tank
+    # operations neither wait for nor fail on page generation.
+    static_site.schedule_leaderboard_page()
+
+# Valid tier cells (1..10); anything else is rejected without going through int().
+_TIER_RANGE = range(1, 11)
+_TIER_BY_TEXT = {str(t): t for t in _TIER_RANGE}
+
+def _tank_fields_error(tier: int, ttype: str) -> str | None:
+    """Return the reply for an invalid tier/type pair, or None if both are valid."""
+    if tier not in _TIER_RANGE:
+        return "Tier must be 1..10."
+    if ttype not in utils.TANK_TYPES:
+        return "Type must be one of: light, medium, heavy, td."
+    return None
+
+def _csv_buffer(header: list[str], rows) -> io.BytesIO:
+    # Encode straight into the byte buffer instead of building a str first.
+    # csv writes None as an empty cell.
+    buf = io.BytesIO()
+    text = io.TextIOWrapper(buf, encoding="utf-8", newline="", write_through=True)
+    w = csv.writer(text)
+    w.writerow(header)
+    w.writerows(rows)
+    text.detach()
+    buf.seek(0)
+    return buf
+
+# Encoded roster export, reused until the roster changes.
+_ROSTER_CSV_CACHE: tuple[tuple, bytes] | None = None
+
+async def _roster_csv_bytes() -> bytes:
+    global _ROSTER_CSV_CACHE
+    key = (config.DB_PATH, db.name_cache_generation())
+    if _ROSTER_CSV_CACHE is not None and _ROSTER_CSV_CACHE[0] == key:
+        return _ROSTER_CSV_CACHE[1]
+    rows = await db.list_tanks()
+    data = _csv_buffer(["name", "tier", "type"], rows).getvalue()
+    # Skip caching if the roster changed while it was being read.
+    if key == (config.DB_PATH, db.name_cache_generation()):
+        _ROSTER_CSV_CACHE = (key, data)
+    return data
 
 def register(tree: app_commands.CommandTree, bot: discord.Client, guild: discord.Object | None):
     grp = Tank()
@@ -43,31 +81,32 @@ def register(tree: app_commands.CommandTree, bot: discord.Client, guild: discord
             return
         name = utils.validate_text('Tank name', name, 64)
         type = type.strip().lower()
-        if not (1 <= tier <= 10):
-            await interaction.response.send_message("Tier must be 1..10.", ephemeral=True)
-            return
-        if type not in ("light", "medium", "heavy", "td"):
-            await interaction.response.send_message("Type must be one of: light, medium, heavy, td.", ephemeral=True)
+        error = _tank_fields_error(tier, type)
+        if error:
+            await interaction.response.send_message(error, ephemeral=True)
             return
+        await interaction.response.defer(ephemeral=True, thinking=True)
         t = await db.get_tank_canonical(name)
         if t:
-            await interaction.response.send_message("Tank already exists.", ephemeral=True)
+            await interaction.followup.send("Tank already exists.", ephemeral=True)
             return
 
         await db.add_tank(name, tier, type, interaction.user.display_name, utils.utc_now_z())
-        await forum_index.targeted_update(bot, tier, type)
-        await _refresh_webpage()
-        await audit_channel.send(
-            interaction.client,
-            (
-                "🧾 [tank add] "
-                f"name={name} "
-                f"tier={tier} "
-                f"type={type} "
-                f"actor={interaction.user.display_name}"
+        _refresh_webpage()
+        await asyncio.gather(
+            forum_index.targeted_update(bot, tier, type),
+            audit_channel.send(
+                interaction.client,
+                (
+                    "🧾 [tank add] "
+                    f"name={name} "
+                    f"tier={tier} "
+                    f"type={type} "
+                    f"actor={interaction.user.display_name}"
+                ),
             ),
         )
-        await interaction.response.send_message(f"✅ Added **{name}** (Tier {tier}, {utils.title_case_type(type)}).", ephemeral=True)
+        await interaction.followup.send(f"✅ Added **{name}** (Tier {tier}, {utils.title_case_type(type)}).", ephemeral=True)
 
     @add.autocomplete("name")
     async def add_name_autocomplete(_interaction: discord.Interaction, current: str):
@@ -86,20 +125,14 @@ def register(tree: app_commands.CommandTree, bot: discord.Client, guild: discord
             return
         name = utils.validate_text('Tank name', name, 64)
         type = type.strip().lower()
-        t = await db.get_tank(name)
-        if not t:
-            await interaction.response.send_message(await _tank_not_found_message(name), ephemeral=True)
-            return
-        old_tier, old_type = int(t[1]), t[2]
-        if not (1 <= tier <= 10):
-            await interaction.response.send_message("Tier must be 1..10.", ephemeral=True)
+        error = _tank_fields_error(tier, type)
+        if error:
+            await interaction.response.send_message(error, ephemeral=True)
             return
-        if type not in ("light", "medium", "heavy", "td"):
-            await interaction.response.send_message("Type must be one of: light, medium, heavy, td.", ephemeral=True)
-            return
-
+        await interaction.response.defer(ephemeral=True, thinking=True)
+        # edit_tank looks the tank up itself and reports the old bucket.
         try:
-            await db.edit_tank(
+            updated = await db.edit_tank(
                 name=name,
                 tier=tier,
                 ttype=type,
@@ -107,25 +140,35 @@ def register(tree: app_commands.CommandTree, bot: discord.Client, guild: discord
                 created_at=utils.utc_now_z(),
             )
         except ValueError as e:
-            await interaction.response.send_message(f"❌ {e}", ephemeral=True)
-            return
-        # Update both old and new buckets
-        await forum_index.targeted_update(bot, old_tier, old_type)
-        await forum_index.targeted_update(bot, tier, type)
-        await _refresh_webpage()
-        await audit_channel.send(
-            interaction.client,
-            (
-                "🧾 [tank edit] "
-                f"name={name} "
-                f"old_tier={old_tier} "
-                f"old_type={old_type} "
-                f"new_tier={tier} "
-                f"new_type={type} "
-                f"actor={interaction.user.display_name}"
+            await interaction.followup.send(f"❌ {e}", ephemeral=True)
+            return
+        if updated is None:
+            await interaction.followup.send(await _tank_not_found_message(name), ephemeral=True)
+            return
+        if updated["unchanged"]:
+            # Nothing bucket-relevant changed: no write, index or page refresh.
+            await interaction.followup.send("No changes were applied (tank already has those values).", ephemeral=True)
+            return
+        old_tier, old_type = updated["old_tier"], updated["old_type"]
+        _refresh_webpage()
+        # Update both old and new buckets (once if the bucket did not change)
+        # while the audit message is posted.
+        await asyncio.gather(
+            forum_index.targeted_update_many(bot, [(old_tier, old_type), (tier, type)]),
+            audit_channel.send(
+                interaction.client,
+                (
+                    "🧾 [tank edit] "
+                    f"name={name} "
+                    f"old_tier={old_tier} "
+                    f"old_type={old_type} "
+                    f"new_tier={tier} "
+                    f"new_type={type} "
+                    f"actor={interaction.user.display_name}"
+                ),
             ),
         )
-        await interaction.response.send_message(f"✅ Updated **{name}**.", ephemeral=True)
+        await interaction.followup.send(f"✅ Updated **{name}**.", ephemeral=True)
 
     @grp.command(name="remove", description="Remove a tank (commanders only, only if no submissions)")
     async def remove(interaction: discord.Interaction, name: str):
@@ -133,29 +176,32 @@ def register(tree: app_commands.CommandTree, bot: discord.Client, guild: discord
             await interaction.response.send_message("Nope. Only **Clan Commanders** can remove tanks.", ephemeral=True)
             return
         name = utils.validate_text('Tank name', name, 64)
-        t = await db.get_tank(name)
-        if not t:
-            await interaction.response.send_message(await _tank_not_found_message(name), ephemeral=True)
-            return
-        tier, ttype = int(t[1]), t[2]
+        await interaction.response.defer(ephemeral=True, thinking=True)
         try:
-            await db.remove_tank(name, interaction.user.display_name, utils.utc_now_z())
-        except Exception as e:
-            await interaction.response.send_message(f"❌ {type(e).__name__}: {e}", ephemeral=True)
+            removed = await db.remove_tank(name, interaction.user.display_name, utils.utc_now_z())
+        except ValueError as e:
+            # remove_tank's domain error (tank still has submissions).
+            await interaction.followup.send(f"❌ {e}", ephemeral=True)
             return
-        await forum_index.targeted_update(bot, tier, ttype)
-        await _refresh_webpage()
-        await audit_channel.send(
-            interaction.client,
-            (
-                "🧾 [tank remove] "
-                f"name={name} "
-                f"tier={tier} "
-                f"type={ttype} "
-                f"actor={interaction.user.display_name}"
+        if removed is None:
+            await interaction.followup.send(await _tank_not_found_message(name), ephemeral=True)
+            return
+        _name, tier, ttype = removed
+        _refresh_webpage()
+        await asyncio.gather(
+            forum_index.targeted_update(bot, tier, ttype),
+            audit_channel.send(
+                interaction.client,
+                (
+                    "🧾 [tank remove] "
+                    f"name={name} "
+                    f"tier={tier} "
+                    f"type={ttype} "
+                    f"actor={interaction.user.display_name}"
+                ),
             ),
         )
-        await interaction.response.send_message(f"✅ Removed **{name}**.", ephemeral=True)
+        await interaction.followup.send(f"✅ Removed **{name}**.", ephemeral=True)
 
     @grp.command(name="list", description="List tanks (commanders only)")
     async def list_cmd(interaction: discord.Interaction, tier: int | None = None, type: str | None = None):
@@ -164,13 +210,19 @@ def register(tree: app_commands.CommandTree, bot: discord.Client, guild: discord
             return
         if type is not None:
             type = type.strip().lower()
-        rows = await db.list_tanks(tier=tier, ttype=type)
+        rows = await db.list_tanks(tier=tier, ttype=type, limit=200)
         if not rows:
             await interaction.response.send_message("No tanks found.", ephemeral=True)
             return
         lines = ["**Tanks**"]
-        for n, tr, tp in rows[:200]:
-            lines.append(f"- **{n}** — Tier {tr}, {utils.title_case_type(tp)}")
+        size = len(lines[0])
+        for n, tr, tp in rows:
+            line = f"- **{n}** — Tier {tr}, {utils.title_case_type(tp)}"
+            lines.append(line)
+            size += len(line) + 1
+            if size > 1800:
+                # Everything past here would be cut by the truncation below.
+                break
         msg = "\n".join(lines)
         if len(msg) > 1800:
             msg = msg[:1800] + "\n…(truncated)"
@@ -200,40 +252,41 @@ def register(tree: app_commands.CommandTree, bot: discord.Client, guild: discord
         if utils.norm_tank_name(current_name) == utils.norm_tank_name(new_name):
             await interaction.response.send_message("Current and new names are the same.", ephemeral=True)
             return
-
-        existing = await db.get_tank(current_name)
-        if not existing:
-            await interaction.response.send_message(await _tank_not_found_message(current_name), ephemeral=True)
-            return
-        tier, ttype = int(existing[1]), str(existing[2])
+        await interaction.response.defer(ephemeral=True, thinking=True)
 
         try:
-            await db.edit_tank(
+            renamed = await db.edit_tank(
                 name=current_name,
-                tier=tier,
-                ttype=ttype,
+                tier=None,
+                ttype=None,
                 actor=interaction.user.display_name,
                 created_at=utils.utc_now_z(),
                 new_name=new_name,
             )
         except ValueError as e:
-            await interaction.response.send_message(f"❌ {e}", ephemeral=True)
+            await interaction.followup.send(f"❌ {e}", ephemeral=True)
             return
+        if renamed is None:
+            await interaction.followup.send(await _tank_not_found_message(current_name), ephemeral=True)
+            return
+        tier, ttype = renamed["tier"], renamed["ttype"]
 
-        await forum_index.targeted_update(bot, tier, ttype)
-        await _refresh_webpage()
-        await audit_channel.send(
-            interaction.client,
-            (
-                "🧾 [tank rename] "
-                f"from={current_name} "
-                f"to={new_name} "
-                f"tier={tier} "
-                f"type={ttype} "
-                f"actor={interaction.user.display_name}"
+        _refresh_webpage()
+        await asyncio.gather(
+            forum_index.targeted_update(bot, tier, ttype),
+            audit_channel.send(
+                interaction.client,
+                (
+                    "🧾 [tank rename] "
+                    f"from={current_name} "
+                    f"to={new_name} "
+                    f"tier={tier} "
+                    f"type={ttype} "
+                    f"actor={interaction.user.display_name}"
+                ),
             ),
         )
-        await interaction.response.send_message(
+        await interaction.followup.send(
             f"✅ Renamed **{current_name}** -> **{new_name}**.",
             ephemeral=True,
         )
@@ -287,8 +340,13 @@ def register(tree: app_commands.CommandTree, bot: discord.Client, guild: discord
             await interaction.response.send_message("No tank aliases configured.", ephemeral=True)
             return
         lines = ["**Tank aliases**"]
+        size = len(lines[0])
         for alias, tank_name, created in rows:
-            lines.append(f"- **{alias}** -> **{tank_name}** • {created}Z")
+            line = f"- **{alias}** -> **{tank_name}** • {created}Z"
+            lines.append(line)
+            size += len(line) + 1
+            if size > 1800:
+                break
         msg = "\n".join(lines)
         if len(msg) > 1800:
             msg = msg[:1800] + "\n…(truncated)"
@@ -299,6 +357,7 @@ def register(tree: app_commands.CommandTree, bot: discord.Client, guild: discord
         if not _require_admin(interaction):
             await interaction.response.send_message("Nope. You need **Manage Server**.", ephemeral=True)
             return
+        await interaction.response.defer(ephemeral=True, thinking=True)
         pairs = [
             ("AMX AC 46", "AMX AC mle. 46"),
             ("Ru 251", "Spähpanzer Ru 251"),
@@ -314,15 +373,15 @@ def register(tree: app_commands.CommandTree, bot: discord.Client, guild: discord
             ("D.W. 2", "D.W.2"),
             ("T-28 mod. 1940", "T-28 mod.1940"),
         ]
-        added = 0
-        skipped = 0
-        for alias, canonical_name in pairs:
-            canonical = await db.get_tank_canonical(canonical_name)
-            if not canonical:
-                skipped += 1
-                continue
-            await db.upsert_tank_alias(alias, canonical[0], utils.utc_now_z())
-            added += 1
+        canon_map = await db.get_tanks_canonical_bulk([c for _, c in pairs])
+        created_at = utils.utc_now_z()
+        to_upsert = [
+            (alias, canon_map[canonical_name][0], created_at)
+            for alias, canonical_name in pairs
+            if canonical_name in canon_map
+        ]
+        added = await db.upsert_tank_aliases_bulk(to_upsert)
+        skipped = len(pairs) - added
         await audit_channel.send(
             interaction.client,
             (
@@ -332,7 +391,7 @@ def register(tree: app_commands.CommandTree, bot: discord.Client, guild: discord
                 f"skipped={skipped}"
             ),
         )
-        await interaction.response.send_message(
+        await interaction.followup.send(
             f"✅ Seeded aliases. Added **{added}**, skipped **{skipped}** (missing canonical targets).",
             ephemeral=True,
         )
@@ -362,22 +421,28 @@ def register(tree: app_commands.CommandTree, bot: discord.Client, guild: discord
             await interaction.followup.send("Source or target tank not found.", ephemeral=True)
             return
 
-        canonical = await db.get_tank_canonical(result["target"])
-        if canonical:
-            _n, tier, ttype = canonical
-            await forum_index.targeted_update(bot, int(tier), str(ttype))
-        await _refresh_webpage()
-        await audit_channel.send(
-            interaction.client,
-            (
-                "🧾 [tank merge] "
-                f"source={result['source']} "
-                f"target={result['target']} "
-                f"moved={result['moved']} "
-                f"deleted={result['deleted']} "
-                f"upgraded={result['upgraded']} "
-                f"remove_source={result['remove_source']} "
-                f"actor={interaction.user.display_name}"
+        _refresh_webpage()
+        # Submissions left the source bucket and landed in the target's.
+        await asyncio.gather(
+            forum_index.targeted_update_many(
+                bot,
+                [
+                    (result["source_tier"], result["source_type"]),
+                    (result["target_tier"], result["target_type"]),
+                ],
+            ),
+            audit_channel.send(
+                interaction.client,
+                (
+                    "🧾 [tank merge] "
+                    f"source={result['source']} "
+                    f"target={result['target']} "
+                    f"moved={result['moved']} "
+                    f"deleted={result['deleted']} "
+                    f"upgraded={result['upgraded']} "
+                    f"remove_source={result['remove_source']} "
+                    f"actor={interaction.user.display_name}"
+                ),
             ),
         )
         await interaction.followup.send(
@@ -411,8 +476,13 @@ def register(tree: app_commands.CommandTree, bot: discord.Client, guild: discord
             await interaction.response.send_message("No changes logged.", ephemeral=True)
             return
         lines = ["**Tank changes**"]
+        size = len(lines[0])
         for _id, action, details, actor, created in rows:
-            lines.append(f"- #{_id} **{action}** `{details}` by **{actor}** • {created}Z")
+            line = f"- #{_id} **{action}** `{details}` by **{actor}** • {created}Z"
+            lines.append(line)
+            size += len(line) + 1
+            if size > 1800:
+                break
         msg = "\n".join(lines)
         if len(msg) > 1800:
             msg = msg[:1800] + "\n…(truncated)"
@@ -423,13 +493,7 @@ def register(tree: app_commands.CommandTree, bot: discord.Client, guild: discord
         if not _require_commander(interaction):
             await interaction.response.send_message("Nope. Only **Clan Commanders** can export tanks.", ephemeral=True)
             return
-        rows = await db.list_tanks()
-        out = io.StringIO()
-        w = csv.writer(out)
-        w.writerow(["name", "tier", "type"])
-        for n, tr, tp in rows:
-            w.writerow([n, tr, tp])
-        data = out.getvalue().encode("utf-8")
+        data = await _roster_csv_bytes()
         await interaction.response.send_message("CSV export:", ephemeral=True, file=discord.File(io.BytesIO(data), filename="tanks.csv"))
 
     @grp.command(name="export_scores_csv", description="Export best score per tank as CSV (commanders only)")
@@ -438,22 +502,11 @@ def register(tree: app_commands.CommandTree, bot: discord.Client, guild: discord
             await interaction.response.send_message("Nope. Only **Clan Commanders** can export tanks.", ephemeral=True)
             return
         rows = await db.list_tanks_with_best_scores()
-        out = io.StringIO()
-        w = csv.writer(out)
-        w.writerow(["tank", "score", "player", "tier", "type"])
-        for tank_name, score, player_name, tier, ttype in rows:
-            w.writerow([
-                tank_name,
-                ("" if score is None else score),
-                ("" if player_name is None else player_name),
-                tier,
-                ttype,
-            ])
-        data = out.getvalue().encode("utf-8")
+        buf = _csv_buffer(["tank", "score", "player", "tier", "type"], rows)
         await interaction.response.send_message(
             "CSV export (best score per tank):",
             ephemeral=True,
-            file=discord.File(io.BytesIO(data), filename="tank_scores.csv"),
+            file=discord.File(buf, filename="tank_scores.csv"),
         )
 
     @grp.command(name="preview_import", description="Preview CSV import (no changes)")
@@ -461,20 +514,31 @@ def register(tree: app_commands.CommandTree, bot: discord.Client, guild: discord
         if not _require_admin(interaction):
             await interaction.response.send_message("Nope. You need **Manage Server**.", ephemeral=True)
             return
-        raw = (await csv_file.read()).decode("utf-8", errors="replace")
-        r = csv.DictReader(io.StringIO(raw))
+        upload_error = utils.csv_upload_error(csv_file.size)
+        if upload_error:
+            await interaction.response.send_message(upload_error, ephemeral=True)
+            return
+        await interaction.response.defer(ephemeral=True, thinking=True)
+        upload = utils.CsvUpload(await csv_file.read())
+        if not upload.header:
+            await interaction.followup.send("CSV has no header row.", ephemeral=True)
+            return
+        name_col = upload.column("name")
+        tier_col = upload.column("tier")
+        type_col = upload.column("type")
         incoming = {}
-        for row in r:
-            name = utils.validate_text('Tank name', (row.get('name') or ''), 64) if (row.get('name') or '').strip() else ''
-            if not name:
+        for _line, row in upload.rows():
+            raw_name = row[name_col].strip()
+            if not raw_name:
                 continue
-            incoming[name] = (int(row.get("tier") or 0), (row.get("type") or "").strip().lower())
+            name = utils.validate_text('Tank name', raw_name, 64)
+            incoming[name] = (int(row[tier_col] or 0), row[type_col].strip().lower())
 
-        existing = {n: (int(t), tp) for n, t, tp in await db.list_tanks()}
-
-        adds = [n for n in incoming.keys() if n not in existing]
-        edits = [n for n in incoming.keys() if n in existing and incoming[n] != existing[n]]
-        removes = [n for n in existing.keys() if n not in incoming] if delete_missing else []
+        adds, edits, removes = await db.diff_tanks(
+            [(name, tier, ttype) for name, (tier, ttype) in incoming.items()]
+        )
+        if not delete_missing:
+            removes = []
 
         lines = ["**Preview import**"]
         lines.append(f"- Adds: {len(adds)}")
@@ -486,7 +550,7 @@ def register(tree: app_commands.CommandTree, bot: discord.Client, guild: discord
             lines.append("\n**Edits**: " + ", ".join(edits[:30]) + ("…" if len(edits)>30 else ""))
         if removes:
             lines.append("\n**Removes**: " + ", ".join(removes[:30]) + ("…" if len(removes)>30 else ""))
-        await interaction.response.send_message("\n".join(lines), ephemeral=True)
+        await interaction.followup.send("\n".join(lines), ephemeral=True)
 
     @grp.command(name="import_csv", description="Import tanks from CSV (admins only)")
     @app_commands.describe(file="CSV file with columns: name,tier,type")
@@ -495,15 +559,22 @@ def register(tree: app_commands.CommandTree, bot: discord.Client, guild: discord
             await interaction.response.send_message("Nope. You need **Manage Server**.", ephemeral=True)
             return
 
+        # Reject empty/oversized uploads from the attachment metadata, before
+        # deferring or downloading anything.
+        upload_error = utils.csv_upload_error(file.size)
+        if upload_error:
+            await interaction.response.send_message(upload_error, ephemeral=True)
+            return
         await interaction.response.defer(ephemeral=True)
 
-        data = await file.read()
-        text = data.decode("utf-8-sig", errors="replace")
-
-        reader = csv.DictReader(io.StringIO(text))
-        if not reader.fieldnames:
+        # Index rows by header position instead of building a dict per row.
+        upload = utils.CsvUpload(await file.read())
+        if not upload.header:
             await interaction.followup.send("CSV has no header row.", ephemeral=True)
             return
+        name_col = upload.column("name")
+        tier_col = upload.column("tier")
+        type_col = upload.column("type")
 
         to_add: list[tuple[str, int, str]] = []
         added = 0
@@ -511,27 +582,35 @@ def register(tree: app_commands.CommandTree, bot: discord.Client, guild: discord
         errors: list[str] = []
         created_at = utils.utc_now_z()
 
-        for i, row in enumerate(reader, start=2):
-            name = (row.get("name") or "").strip()
-            tier_raw = (row.get("tier") or "").strip()
-            ttype = (row.get("type") or "").strip().lower()
-
-            if not name or not tier_raw or not ttype:
-                errors.append(f"Line {i}: missing name/tier/type")
-                continue
-            try:
-                tier = int(tier_raw)
-            except ValueError:
-                errors.append(f"Line {i}: invalid tier '{tier_raw}'")
-                continue
-
-            try:
-                name = utils.validate_text("Tank name", name, 64)
-            except Exception as e:
-                errors.append(f"Line {i}: invalid name '{name}': {e}")
-                continue
-
-            to_add.append((name, tier, ttype))
+        def parse_rows():
+            # Runs in a worker thread (see below); it only touches this import's
+            # own lists.
+            for i, row in upload.rows():
+                name = row[name_col].strip()
+                tier_raw = row[tier_col].strip()
+                ttype = row[type_col].strip().lower()
+
+                if not name or not tier_raw or not ttype:
+                    errors.append(f"Line {i}: missing name/tier/type")
+                    continue
+                tier = _TIER_BY_TEXT.get(tier_raw)
+                if tier is None:
+                    errors.append(f"Line {i}: invalid tier '{tier_raw}'")
+                    continue
+                if ttype not in utils.TANK_TYPES:
+                    errors.append(f"Line {i}: invalid type '{ttype}'")
+                    continue
+
+                try:
+                    name = utils.validate_text("Tank name", name, 64)
+                except ValueError as e:
+                    errors.append(f"Line {i}: invalid name '{name}': {e}")
+                    continue
+
+                to_add.append((name, tier, ttype))
+
+        # Same as /highscore import_scores: decode and validate off the event loop.
+        await asyncio.to_thread(parse_rows)
 
         if to_add:
             added, skipped = await db.add_tanks_bulk(
@@ -539,7 +618,7 @@ def register(tree: app_commands.CommandTree, bot: discord.Client, guild: discord
                 interaction.user.display_name,
                 created_at,
             )
-            await _refresh_webpage()
+            _refresh_webpage()
             await audit_channel.send(
                 interaction.client,
                 (
@@ -554,7 +633,7 @@ def register(tree: app_commands.CommandTree, bot: discord.Client, guild: discord
             )
 
         msg = [
-            f"Parsed: **{reader.line_num}** lines",
+            f"Parsed: **{upload.line_num}** lines",
             f"Added: **{added}**",
             f"Skipped: **{skipped}**",
             f"Errors: **{len(errors)}**",]
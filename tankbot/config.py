@@ -21,12 +21,15 @@ GUILD_ID = _int_env("GUILD_ID", 0)
 
 TANK_INDEX_FORUM_CHANNEL_ID = _int_env("TANK_INDEX_FORUM_CHANNEL_ID", 0)
 TANK_INDEX_NORMAL_CHANNEL_ID = _int_env("TANK_INDEX_NORMAL_CHANNEL_ID", 0)
+TANK_INDEX_UPDATE_CONCURRENCY = max(1, _int_env("TANK_INDEX_UPDATE_CONCURRENCY", 5))  # parallel forum thread refreshes
 ANNOUNCE_CHANNEL_ID = _int_env("ANNOUNCE_CHANNEL_ID", 0)
 AUDIT_LOG_CHANNEL_ID = _int_env("AUDIT_LOG_CHANNEL_ID", 0)
 
 COMMANDER_ROLE_NAME = os.getenv("COMMANDER_ROLE_NAME", "Clan Commander")
 COMMANDER_ROLE_ID = _int_env("COMMANDER_ROLE_ID", 0)
 MAX_SCORE = _int_env("MAX_SCORE", 100000)
+IMPORT_MAX_CSV_BYTES = max(1, _int_env("IMPORT_MAX_CSV_BYTES", 10 * 1024 * 1024))
+IMPORT_COMMIT_ROWS = max(1, _int_env("IMPORT_COMMIT_ROWS", 1000))  # rows per bulk-import transaction
 
 DB_PATH = os.getenv("DB_PATH", "highscores.db")
 
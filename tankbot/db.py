@@ -150,6 +150,9 @@ async def _apply_sqlite_pragmas(db: aiosqlite.Connection):
     await db.execute("PRAGMA busy_timeout = 5000;")
     await db.execute("PRAGMA journal_mode = WAL;")
     await db.execute("PRAGMA synchronous = NORMAL;")
+    await db.execute("PRAGMA temp_store = MEMORY;")
+    await db.execute("PRAGMA mmap_size = 268435456;")
+    await db.execute("PRAGMA cache_size = -64000;")
 
 
 class _InstrumentedConnection:
@@ -170,6 +173,13 @@ class _InstrumentedConnection:
         finally:
             metrics.record_db_latency_ms((time.perf_counter() - t0) * 1000.0)
 
+    async def execute_fetchall(self, *args, **kwargs):
+        t0 = time.perf_counter()
+        try:
+            return await self._inner.execute_fetchall(*args, **kwargs)
+        finally:
+            metrics.record_db_latency_ms((time.perf_counter() - t0) * 1000.0)
+
     async def executescript(self, *args, **kwargs):
         t0 = time.perf_counter()
         try:
@@ -202,12 +212,80 @@ class _InstrumentedConnection:
     def __getattr__(self, name: str):
         return getattr(self._inner, name)
 
+class _ConnectionPool:
+    """
+    Keeps a few idle connections open so each DB call skips connect + pragmas.
+    There is no lock: acquire/release do await (close, connect, pragmas,
+    rollback), but every check-and-pop/append on _idle runs with no await in
+    between, so concurrent tasks cannot hand out the same connection. Keep it
+    that way when changing these methods.
+    """
+
+    def __init__(self, max_idle: int = 4):
+        self.max_idle = max_idle
+        self._path: str | None = None
+        self._idle: list[_InstrumentedConnection] = []
+
+    async def acquire(self) -> _InstrumentedConnection:
+        if self._path != config.DB_PATH:
+            # DB_PATH changed (tests/benchmarks): drop connections to the old file.
+            # Record the new path first so concurrent acquires don't close again.
+            self._path = config.DB_PATH
+            await self.close()
+        if self._idle:
+            return self._idle.pop()
+        conn = _InstrumentedConnection(await aiosqlite.connect(config.DB_PATH))
+        await _apply_sqlite_pragmas(conn)
+        return conn
+
+    async def release(self, conn: _InstrumentedConnection):
+        try:
+            if conn.in_transaction:
+                await conn.rollback()
+            conn.row_factory = None
+        except Exception:
+            await _close_quietly(conn)
+            return
+        if len(self._idle) < self.max_idle and self._path == config.DB_PATH:
+            self._idle.append(conn)
+        else:
+            await _close_quietly(conn)
+
+    async def warm(self):
+        # Open the idle connections up front so concurrent handlers after
+        # startup do not each pay connect + pragmas on their first query.
+        held = [await self.acquire() for _ in range(self.max_idle)]
+        for conn in held:
+            await self.release(conn)
+
+    async def close(self):
+        idle, self._idle = self._idle, []
+        for conn in idle:
+            await _close_quietly(conn)
+
+
+async def _close_quietly(conn: _InstrumentedConnection):
+    try:
+        await conn.close()
+    except Exception:
+        pass
+
+
+_pool = _ConnectionPool()
+
+async def warm_pool():
+    await _pool.warm()
+
+async def close_pool():
+    await _pool.close()
+
 @asynccontextmanager
 async def _connect_db():
-    async with aiosqlite.connect(config.DB_PATH) as conn:
-        wrapped = _InstrumentedConnection(conn)
-        await _apply_sqlite_pragmas(wrapped)
-        yield wrapped
+    conn = await _pool.acquire()
+    try:
+        yield conn
+    finally:
+        await _pool.release(conn)
 
 async def _table_columns(db: aiosqlite.Connection, table_name: str) -> set[str]:
     cur = await db.execute(f"PRAGMA table_info({table_name})")
@@ -695,6 +773,20 @@ async def _migration_011_add_tankopedia_tables(db: aiosqlite.Connection):
     )
 
 
+async def _migration_012_add_covering_score_indexes(db: aiosqlite.Connection):
+    # Covers get_best_for_tank without touching the table; supersedes the
+    # (tank_name, score, id) prefix index from migration 003.
+    await db.execute(
+        "CREATE INDEX IF NOT EXISTS idx_submissions_tank_score_cover "
+        "ON submissions (tank_name, score DESC, id ASC, player_name_raw, created_at)"
+    )
+    await db.execute("DROP INDEX IF EXISTS idx_submissions_tank_score_id")
+    # Champion lookups (global and tier/type filtered) walk scores top-down.
+    await db.execute(
+        "CREATE INDEX IF NOT EXISTS idx_submissions_score_id "
+        "ON submissions (score DESC, id ASC)"
+    )
+
 async def _run_migrations(db: aiosqlite.Connection):
     migrations = [
         (1, _migration_001_cleanup_submission_indexes),
@@ -708,6 +800,7 @@ async def _run_migrations(db: aiosqlite.Connection):
         (9, _migration_009_add_clan_player_tracking),
         (10, _migration_010_add_wg_tank_catalog),
         (11, _migration_011_add_tankopedia_tables),
+        (12, _migration_012_add_covering_score_indexes),
     ]
     for version, fn in migrations:
         cur = await db.execute(
@@ -730,12 +823,17 @@ async def init_db():
         await _run_migrations(db)
         await db.commit()
 
+async def optimize():
+    # Refresh query-planner statistics; cheap when nothing changed.
+    async with _connect_db() as db:
+        await db.execute("PRAGMA optimize;")
+
 async def get_tank(name: str):
     async with _connect_db() as db:
         cur = await db.execute("SELECT name, tier, type FROM tanks WHERE name_norm = ?", (utils.norm_tank_name(name),))
         return await cur.fetchone()
 
-async def list_tanks(tier: int | None = None, ttype: str | None = None):
+async def list_tanks(tier: int | None = None, ttype: str | None = None, limit: int | None = None):
     q = "SELECT name, tier, type FROM tanks"
     args = []
     wh = []
@@ -748,38 +846,81 @@ async def list_tanks(tier: int | None = None, ttype: str | None = None):
     if wh:
         q += " WHERE " + " AND ".join(wh)
     q += " ORDER BY tier DESC, type, name"
-    async with _connect_db() as db:
-        cur = await db.execute(q, tuple(args))
-        return await cur.fetchall()
+    if limit is not None:
+        q += " LIMIT ?"
+        args.append(int(limit))
+    # Roster reads are frequent and writes rare, so results are kept with the
+    # name caches. Callers get their own list (the rows are immutable tuples),
+    # so sorting or trimming it can't corrupt the cached copy.
+    key = (config.DB_PATH, "tanks", tier, ttype, limit)
+    rows = _name_caches.get(key)
+    if rows is None:
+        generation = _name_cache_generation
+        async with _connect_db() as db:
+            rows = [tuple(r) for r in await db.execute_fetchall(q, tuple(args))]
+        if generation == _name_cache_generation:
+            _name_caches[key] = rows
+    return list(rows)
+
+# Autocomplete/suggestion name lists (and list_tanks results) kept in memory
+# so typing and fuzzy suggestions do not hit SQLite on every call. Writers
+# that change tanks, tank aliases, the WG tank catalog or clan players call
+# _invalidate_name_caches() after commit.
+_name_cache_generation = 0
+_name_caches: dict[tuple, list[tuple]] = {}
+# suggest_tank_names_batch results per normalized input; same lifetime.
+_SUGGESTION_MEMO_MAX = 512
+_suggestion_memo: dict[tuple, tuple[str, ...]] = {}
+
+def _invalidate_name_caches():
+    global _name_cache_generation
+    _name_cache_generation += 1
+    _name_caches.clear()
+    _suggestion_memo.clear()
+
+def name_cache_generation() -> int:
+    """Bumped whenever tanks, tank aliases, the WG catalog or clan players change."""
+    return _name_cache_generation
+
+async def _cached_names(key: tuple[str, ...], sql: str, params: tuple = ()) -> list[tuple[str, str]]:
+    key = (config.DB_PATH, *key)
+    entries = _name_caches.get(key)
+    if entries is None:
+        generation = _name_cache_generation
+        async with _connect_db() as db:
+            rows = await db.execute_fetchall(sql, params)
+        entries = [(str(r[0]).casefold(), str(r[0])) for r in rows if r and r[0]]
+        # Don't keep a list that a concurrent write already made stale.
+        if generation == _name_cache_generation:
+            _name_caches[key] = entries
+    return entries
+
+def _match_names(entries: list[tuple[str, str]], query: str, limit: int) -> list[str]:
+    q = query.casefold()
+    if not q:
+        return [name for _folded, name in entries[:limit]]
+    # Prefix matches first (what autocomplete users are usually typing),
+    # then the remaining substring matches, each in cached list order.
+    prefix: list[str] = []
+    inner: list[str] = []
+    for folded, name in entries:
+        pos = folded.find(q)
+        if pos == 0:
+            prefix.append(name)
+            if len(prefix) >= limit:
+                break
+        elif pos > 0 and len(inner) < limit:
+            inner.append(name)
+    return (prefix + inner)[:limit]
 
 async def list_tank_names(query: str = "", limit: int = 25) -> list[str]:
     q = (query or "").strip()
     limit = max(1, min(limit, 25))
-    async with _connect_db() as db:
-        if q:
-            cur = await db.execute(
-                """
-                SELECT name
-                FROM tanks
-                WHERE name LIKE ?
-                ORDER BY tier DESC, type ASC, name ASC
-                LIMIT ?
-                """,
-                (f"%{q}%", limit),
-            )
-        else:
-            cur = await db.execute(
-                """
-                SELECT name
-                FROM tanks
-                ORDER BY tier DESC, type ASC, name ASC
-                LIMIT ?
-                """,
-                (limit,),
-            )
-        rows = await cur.fetchall()
-        await cur.close()
-    return [str(r[0]) for r in rows if r and r[0]]
+    entries = await _cached_names(
+        ("tanks",),
+        "SELECT name FROM tanks ORDER BY tier DESC, type ASC, name ASC",
+    )
+    return _match_names(entries, q, limit)
 
 async def list_wg_tank_catalog_names(
     *,
@@ -815,6 +956,53 @@ async def suggest_tank_names(tank_input: str, limit: int = 3) -> list[str]:
     candidate = (tank_input or "").strip()
     if not candidate:
         return []
+    suggestions = await suggest_tank_names_batch([candidate], limit=limit)
+    return suggestions.get(candidate, [])
+
+async def suggest_tank_names_batch(tank_inputs, limit: int = 3) -> dict[str, list[str]]:
+    """
+    Suggestions for many inputs while loading the candidate names only once.
+    Returns {input: [suggestion, ...]} for each non-empty stripped input.
+    """
+    candidates = {str(v).strip() for v in tank_inputs if v and str(v).strip()}
+    if not candidates:
+        return {}
+    generation = _name_cache_generation
+    entries = await _tank_suggestion_candidates()
+    display_by_norm = dict(entries)
+
+    n = max(1, min(limit, 5))
+    # Retried misspellings hit the memo instead of another difflib scan.
+    memo_key = (config.DB_PATH, _tank_suggestion_region())
+    out: dict[str, list[str]] = {}
+    for candidate in candidates:
+        exact_norm = utils.norm_tank_name(candidate)
+        key = (*memo_key, exact_norm, n)
+        cached = _suggestion_memo.get(key)
+        if cached is not None:
+            out[candidate] = list(cached)
+            continue
+        candidate_norms = [norm for norm, _display in entries if norm != exact_norm]
+        matched_norms = difflib.get_close_matches(exact_norm, candidate_norms, n=n, cutoff=0.72)
+        out[candidate] = [display_by_norm[norm] for norm in matched_norms]
+        if generation == _name_cache_generation:
+            if len(_suggestion_memo) >= _SUGGESTION_MEMO_MAX:
+                _suggestion_memo.clear()
+            _suggestion_memo[key] = tuple(out[candidate])
+    return out
+
+def _tank_suggestion_region() -> str:
+    return str(getattr(config, "WG_TANKS_API_REGION", "eu")).strip().lower() or "eu"
+
+async def _tank_suggestion_candidates() -> list[tuple[str, str]]:
+    """(normalized, display) names from roster, aliases and WG catalog; cached."""
+    catalog_region = _tank_suggestion_region()
+    key = (config.DB_PATH, "tank_suggestions", catalog_region)
+    entries = _name_caches.get(key)
+    if entries is not None:
+        return entries
+
+    generation = _name_cache_generation
     async with _connect_db() as db:
         cur = await db.execute(
             """
@@ -829,7 +1017,7 @@ async def suggest_tank_names(tank_input: str, limit: int = 3) -> list[str]:
     roster_names = [str(r[0]) for r in roster_rows if r and r[0]]
     alias_rows = await list_tank_aliases(limit=500)
     external_names = await list_wg_tank_catalog_names(
-        region=str(getattr(config, "WG_TANKS_API_REGION", "eu")).strip().lower() or "eu",
+        region=catalog_region,
         query="",
         limit=2000,
         active_only=True,
@@ -849,24 +1037,10 @@ async def suggest_tank_names(tank_input: str, limit: int = 3) -> list[str]:
         if norm and norm not in deduped:
             deduped[norm] = str(value)
 
-    if not deduped:
-        return []
-
-    exact_norm = utils.norm_tank_name(candidate)
-    candidates_by_norm = {
-        norm: display
-        for norm, display in deduped.items()
-        if norm != exact_norm
-    }
-    if not candidates_by_norm:
-        return []
-    matched_norms = difflib.get_close_matches(
-        exact_norm,
-        list(candidates_by_norm.keys()),
-        n=max(1, min(limit, 5)),
-        cutoff=0.72,
-    )
-    return [candidates_by_norm[norm] for norm in matched_norms]
+    entries = list(deduped.items())
+    if generation == _name_cache_generation:
+        _name_caches[key] = entries
+    return entries
 
 async def upsert_tank_alias(alias_raw: str, tank_name: str, created_at: str):
     alias_norm = utils.norm_tank_name(alias_raw)
@@ -883,6 +1057,31 @@ async def upsert_tank_alias(alias_raw: str, tank_name: str, created_at: str):
             (alias_norm, str(alias_raw), str(tank_name), str(created_at)),
         )
         await db.commit()
+    _invalidate_name_caches()
+
+async def upsert_tank_aliases_bulk(rows: list[tuple[str, str, str]]) -> int:
+    """Upsert (alias_raw, tank_name, created_at) rows in one transaction."""
+    params = [
+        (utils.norm_tank_name(alias_raw), str(alias_raw), str(tank_name), str(created_at))
+        for alias_raw, tank_name, created_at in rows
+    ]
+    if not params:
+        return 0
+    async with _connect_db() as db:
+        await db.executemany(
+            """
+            INSERT INTO tank_aliases (alias_norm, alias_raw, tank_name, created_at)
+            VALUES (?, ?, ?, ?)
+            ON CONFLICT(alias_norm) DO UPDATE SET
+              alias_raw = excluded.alias_raw,
+              tank_name = excluded.tank_name,
+              created_at = excluded.created_at
+            """,
+            params,
+        )
+        await db.commit()
+    _invalidate_name_caches()
+    return len(params)
 
 async def list_tank_aliases(limit: int = 200):
     limit = max(1, min(limit, 500))
@@ -1101,6 +1300,7 @@ async def replace_wg_tank_catalog(
             )
 
         await conn.commit()
+    _invalidate_name_caches()
 
     return {
         "region": region_norm,
@@ -1438,6 +1638,7 @@ async def replace_clan_players(
             (key, synced_at, synced_at),
         )
         await conn.commit()
+    _invalidate_name_caches()
 
     added_names = sorted([deduped[i][1] for i in added_ids], key=str.casefold)
     removed_names = sorted([existing_by_id[i] for i in removed_ids], key=str.casefold)
@@ -1544,20 +1745,8 @@ async def suggest_player_names(player_input: str, limit: int = 3) -> list[str]:
     candidate = (player_input or "").strip()
     if not candidate:
         return []
-    async with _connect_db() as db:
-        cur = await db.execute(
-            """
-            SELECT player_name_raw
-            FROM clan_players
-            WHERE region = ?
-            ORDER BY player_name_raw COLLATE NOCASE ASC
-            LIMIT 500
-            """,
-            (config.WG_API_REGION,),
-        )
-        rows = await cur.fetchall()
-        await cur.close()
-    choices = [str(r[0]) for r in rows if r and r[0]]
+    entries = await _clan_player_name_entries()
+    choices = [name for _folded, name in entries[:500]]
     if not choices:
         choices = await _list_player_names_from_submissions(query="", limit=25)
     if not choices:
@@ -1567,35 +1756,23 @@ async def suggest_player_names(player_input: str, limit: int = 3) -> list[str]:
     filtered = [c for c in choices if utils.normalize_player(c) != exact_norm]
     return difflib.get_close_matches(candidate, filtered, n=max(1, min(limit, 5)), cutoff=0.82)
 
+async def _clan_player_name_entries() -> list[tuple[str, str]]:
+    return await _cached_names(
+        ("clan_players", config.WG_API_REGION),
+        """
+        SELECT player_name_raw
+        FROM clan_players
+        WHERE region = ?
+        ORDER BY player_name_raw COLLATE NOCASE ASC
+        """,
+        (config.WG_API_REGION,),
+    )
+
 async def list_player_names(query: str = "", limit: int = 25) -> list[str]:
     q = (query or "").strip()
     limit = max(1, min(limit, 25))
-    async with _connect_db() as db:
-        if q:
-            cur = await db.execute(
-                """
-                SELECT player_name_raw
-                FROM clan_players
-                WHERE region = ? AND player_name_raw LIKE ?
-                ORDER BY player_name_raw COLLATE NOCASE ASC
-                LIMIT ?
-                """,
-                (config.WG_API_REGION, f"%{q}%", limit),
-            )
-        else:
-            cur = await db.execute(
-                """
-                SELECT player_name_raw
-                FROM clan_players
-                WHERE region = ?
-                ORDER BY player_name_raw COLLATE NOCASE ASC
-                LIMIT ?
-                """,
-                (config.WG_API_REGION, limit),
-            )
-        rows = await cur.fetchall()
-        await cur.close()
-    names = [str(r[0]) for r in rows if r and r[0]]
+    entries = await _clan_player_name_entries()
+    names = _match_names(entries, q, limit)
     if names:
         return names
     return await _list_player_names_from_submissions(query=q, limit=limit)
@@ -1718,14 +1895,52 @@ async def insert_submission(
 
 async def get_best_for_tank(tank_name: str):
     async with _connect_db() as db:
-        cur = await db.execute("""
+        rows = await db.execute_fetchall("""
         SELECT id, player_name_raw, score, created_at
         FROM submissions
         WHERE tank_name = ? AND score > 0
         ORDER BY score DESC, id ASC
         LIMIT 1;
         """, (tank_name,))
-        return await cur.fetchone()
+        return rows[0] if rows else None
+
+async def get_tank_and_best(tank_input: str):
+    """
+    Resolve a user-entered tank name (like get_tank_canonical, including the
+    alias fallback) and fetch its best submission in one query.
+    Returns ((canonical_name, tier, type) | None, best | None) where best has
+    the get_best_for_tank row shape (id, player_name_raw, score, created_at).
+    """
+    tank_norm = utils.norm_tank_name(tank_input)
+    sql = """
+    WITH t AS (
+        SELECT name, tier, type, 0 AS pri FROM tanks WHERE name_norm = ?
+        UNION ALL
+        SELECT t.name, t.tier, t.type, 1 AS pri
+        FROM tank_aliases a
+        JOIN tanks t ON t.name = a.tank_name
+        WHERE a.alias_norm = ?
+        ORDER BY pri
+        LIMIT 1
+    )
+    SELECT t.name, t.tier, t.type, b.id, b.player_name_raw, b.score, b.created_at
+    FROM t
+    LEFT JOIN submissions b ON b.id = (
+        SELECT id FROM submissions
+        WHERE tank_name = t.name AND score > 0
+        ORDER BY score DESC, id ASC
+        LIMIT 1
+    )
+    """
+    async with _connect_db() as db:
+        rows = await db.execute_fetchall(sql, (tank_norm, tank_norm))
+    if not rows:
+        return None, None
+    name, tier, ttype, best_id, best_player, best_score, best_created = rows[0]
+    tank = (str(name), int(tier), str(ttype))
+    if best_id is None:
+        return tank, None
+    return tank, (best_id, best_player, best_score, best_created)
 
 async def list_tanks_with_best_scores():
     """
@@ -1764,7 +1979,7 @@ async def list_tanks_with_best_scores():
 
 async def get_champion():
     async with _connect_db() as db:
-        cur = await db.execute("""
+        rows = await db.execute_fetchall("""
         SELECT s.id, s.player_name_raw, s.tank_name, s.score,
                s.submitted_by, s.created_at, t.tier, t.type
         FROM submissions s
@@ -1773,7 +1988,7 @@ async def get_champion():
         ORDER BY s.score DESC, s.id ASC
         LIMIT 1;
         """)
-        return await cur.fetchone()
+        return rows[0] if rows else None
 
 async def get_recent(limit: int, tier: int | None = None, ttype: str | None = None):
     where: list[str] = []
@@ -1789,7 +2004,7 @@ async def get_recent(limit: int, tier: int | None = None, ttype: str | None = No
     params.append(int(limit))
 
     async with _connect_db() as db:
-        cur = await db.execute(f"""
+        rows = await db.execute_fetchall(f"""
         SELECT s.id, s.player_name_raw, s.tank_name, s.score,
                s.submitted_by, s.created_at, t.tier, t.type
         FROM submissions s
@@ -1798,63 +2013,54 @@ async def get_recent(limit: int, tier: int | None = None, ttype: str | None = No
         ORDER BY s.id DESC
         LIMIT ?;
         """, tuple(params))
-        return await cur.fetchall()
+        return rows
 
-async def top_holders_by_tank(limit: int = 10):
+async def top_holders_combined(limit: int = 10):
+    """
+    Both top-holder rankings in one round-trip.
+    Returns (by_tank, by_tier_type), each a list of (player_name_raw, tops).
+    """
     limit = max(1, min(limit, 25))
     async with _connect_db() as db:
-        cur = await db.execute("""
+        rows = await db.execute_fetchall("""
         WITH ranked AS (
             SELECT
                 s.player_name_raw,
                 s.player_name_norm,
-                s.tank_name,
-                s.score,
                 s.id,
                 ROW_NUMBER() OVER (
                     PARTITION BY s.tank_name
                     ORDER BY s.score DESC, s.id ASC
-                ) AS rn
-            FROM submissions s
-            WHERE s.score > 0
-        )
-        SELECT player_name_raw, COUNT(*) AS tops
-        FROM ranked
-        WHERE rn = 1
-        GROUP BY player_name_norm
-        ORDER BY tops DESC, MIN(id) ASC
-        LIMIT ?;
-        """, (limit,))
-        return await cur.fetchall()
-
-async def top_holders_by_tier_type(limit: int = 10):
-    limit = max(1, min(limit, 25))
-    async with _connect_db() as db:
-        cur = await db.execute("""
-        WITH ranked AS (
-            SELECT
-                s.player_name_raw,
-                s.player_name_norm,
-                t.tier,
-                t.type,
-                s.score,
-                s.id,
+                ) AS tank_rn,
                 ROW_NUMBER() OVER (
                     PARTITION BY t.tier, t.type
                     ORDER BY s.score DESC, s.id ASC
-                ) AS rn
+                ) AS bucket_rn
             FROM submissions s
             JOIN tanks t ON t.name = s.tank_name
             WHERE s.score > 0
         )
-        SELECT player_name_raw, COUNT(*) AS tops
-        FROM ranked
-        WHERE rn = 1
-        GROUP BY player_name_norm
-        ORDER BY tops DESC, MIN(id) ASC
-        LIMIT ?;
-        """, (limit,))
-        return await cur.fetchall()
+        SELECT * FROM (
+            SELECT 'tank' AS kind, player_name_raw, COUNT(*) AS tops
+            FROM ranked
+            WHERE tank_rn = 1
+            GROUP BY player_name_norm
+            ORDER BY tops DESC, MIN(id) ASC
+            LIMIT ?
+        )
+        UNION ALL
+        SELECT * FROM (
+            SELECT 'bucket' AS kind, player_name_raw, COUNT(*) AS tops
+            FROM ranked
+            WHERE bucket_rn = 1
+            GROUP BY player_name_norm
+            ORDER BY tops DESC, MIN(id) ASC
+            LIMIT ?
+        );
+        """, (limit, limit))
+        by_tank = [(player, tops) for kind, player, tops in rows if kind == "tank"]
+        by_bucket = [(player, tops) for kind, player, tops in rows if kind == "bucket"]
+        return by_tank, by_bucket
 
 async def stats_top_per_tier(limit_per_tier: int = 3):
     limit_per_tier = max(1, min(limit_per_tier, 10))
@@ -2028,8 +2234,56 @@ async def add_tank(name: str, tier: int, ttype: str, actor: str, created_at: str
             (name, name_norm, tier, ttype, created_at),
         )
         await db.commit()
+    _invalidate_name_caches()
     await log_tank_change("add", f"{name}|tier={tier}|type={ttype}", actor, created_at)
 
+async def diff_tanks(incoming: list[tuple[str, int, str]]) -> tuple[list[str], list[str], list[str]]:
+    """
+    Compare an incoming roster (name, tier, type) against the tanks table.
+    Returns (adds, edits, removes) as tank names: adds/edits in incoming
+    order, removes in list_tanks order.
+    """
+    async with _connect_db() as conn:
+        # Stage the payload and let SQLite do the joins (same approach as the
+        # bulk score import) instead of pulling the whole roster into Python.
+        await conn.execute(
+            "CREATE TEMP TABLE IF NOT EXISTS _incoming_tanks "
+            "(ord INTEGER NOT NULL, name TEXT PRIMARY KEY, tier INTEGER NOT NULL, type TEXT NOT NULL)"
+        )
+        await conn.execute("DELETE FROM _incoming_tanks")
+        await conn.executemany(
+            "INSERT INTO _incoming_tanks (ord, name, tier, type) VALUES (?, ?, ?, ?)",
+            [(i, name, int(tier), str(ttype)) for i, (name, tier, ttype) in enumerate(incoming)],
+        )
+        adds = await conn.execute_fetchall(
+            """
+            SELECT i.name FROM _incoming_tanks i
+            WHERE NOT EXISTS (SELECT 1 FROM tanks t WHERE t.name = i.name)
+            ORDER BY i.ord
+            """
+        )
+        edits = await conn.execute_fetchall(
+            """
+            SELECT i.name FROM _incoming_tanks i
+            JOIN tanks t ON t.name = i.name
+            WHERE t.tier <> i.tier OR t.type <> i.type
+            ORDER BY i.ord
+            """
+        )
+        removes = await conn.execute_fetchall(
+            """
+            SELECT t.name FROM tanks t
+            WHERE NOT EXISTS (SELECT 1 FROM _incoming_tanks i WHERE i.name = t.name)
+            ORDER BY t.tier DESC, t.type, t.name
+            """
+        )
+        await conn.execute("DELETE FROM _incoming_tanks")
+    return (
+        [str(r[0]) for r in adds],
+        [str(r[0]) for r in edits],
+        [str(r[0]) for r in removes],
+    )
+
 async def add_tanks_bulk(rows: list[tuple[str, int, str]], actor: str, created_at: str) -> tuple[int, int]:
     """
     Add many tanks in one transaction.
@@ -2051,9 +2305,19 @@ async def add_tanks_bulk(rows: list[tuple[str, int, str]], actor: str, created_a
         )
 
     async with _connect_db() as db:
-        cur = await db.execute("SELECT name_norm FROM tanks")
-        existing = {str(r[0]) for r in await cur.fetchall()}
-        await cur.close()
+        # Only look up the payload's keys instead of reading the whole roster.
+        payload_norms = list({row[1] for row in normalized_rows})
+        existing: set[str] = set()
+        for start in range(0, len(payload_norms), 500):
+            chunk = payload_norms[start:start + 500]
+            placeholders = ",".join("?" for _ in chunk)
+            existing.update(
+                str(r[0])
+                for r in await db.execute_fetchall(
+                    f"SELECT name_norm FROM tanks WHERE name_norm IN ({placeholders})",
+                    chunk,
+                )
+            )
 
         to_insert: list[tuple[str, str, int, str, str]] = []
         seen_in_payload: set[str] = set()
@@ -2077,6 +2341,7 @@ async def add_tanks_bulk(rows: list[tuple[str, int, str]], actor: str, created_a
                 ],
             )
             await db.commit()
+            _invalidate_name_caches()
 
     added = len(to_insert)
     skipped = len(rows) - added
@@ -2084,21 +2349,43 @@ async def add_tanks_bulk(rows: list[tuple[str, int, str]], actor: str, created_a
 
 async def edit_tank(
     name: str,
-    tier: int,
-    ttype: str,
+    tier: int | None,
+    ttype: str | None,
     actor: str,
     created_at: str,
     new_name: str | None = None,
 ):
-    existing = await get_tank(name)
-    if not existing:
-        raise ValueError("Tank not found.")
-    old_name = str(existing[0])
-    old_name_norm = utils.norm_tank_name(old_name)
-    final_name = str(new_name or old_name).strip()
-    final_name_norm = utils.norm_tank_name(final_name)
-
+    """
+    Update a tank's tier/type (None keeps the current value) and optionally
+    rename it, all in one transaction together with the change-log entry.
+    Returns None if the tank does not exist, otherwise a dict with
+    name/old_name/old_tier/old_type/tier/ttype/unchanged.
+    """
     async with _connect_db() as db:
+        rows = await db.execute_fetchall(
+            "SELECT name, tier, type FROM tanks WHERE name_norm = ?",
+            (utils.norm_tank_name(name),),
+        )
+        if not rows:
+            return None
+        old_name, old_tier, old_type = str(rows[0][0]), int(rows[0][1]), str(rows[0][2])
+        old_name_norm = utils.norm_tank_name(old_name)
+        final_name = str(new_name or old_name).strip()
+        final_name_norm = utils.norm_tank_name(final_name)
+        tier = old_tier if tier is None else int(tier)
+        ttype = old_type if ttype is None else str(ttype)
+        result = {
+            "name": final_name,
+            "old_name": old_name,
+            "old_tier": old_tier,
+            "old_type": old_type,
+            "tier": tier,
+            "ttype": ttype,
+            "unchanged": (final_name, tier, ttype) == (old_name, old_tier, old_type),
+        }
+        if result["unchanged"]:
+            return result
+
         if final_name_norm != old_name_norm:
             cur = await db.execute(
                 "SELECT name FROM tanks WHERE name_norm = ? LIMIT 1",
@@ -2133,13 +2420,13 @@ async def edit_tank(
                 "UPDATE tank_aliases SET tank_name = ? WHERE tank_name = ?",
                 (final_name, old_name),
             )
+        await db.execute(
+            "INSERT INTO tank_changes (action, details, actor, created_at) VALUES (?,?,?,?)",
+            ("edit", f"{old_name}->{final_name}|tier={tier}|type={ttype}", actor, created_at),
+        )
         await db.commit()
-    await log_tank_change(
-        "edit",
-        f"{old_name}->{final_name}|tier={tier}|type={ttype}",
-        actor,
-        created_at,
-    )
+    _invalidate_name_caches()
+    return result
 
 async def tank_has_submissions(name: str) -> bool:
     async with _connect_db() as db:
@@ -2147,14 +2434,35 @@ async def tank_has_submissions(name: str) -> bool:
         return (await cur.fetchone()) is not None
 
 async def remove_tank(name: str, actor: str, created_at: str):
-    existing = await get_tank(name)
-    canonical_name = str(existing[0]) if existing else str(name)
-    if await tank_has_submissions(canonical_name):
-        raise ValueError("Tank has submissions and cannot be removed.")
+    """
+    Remove a tank without submissions, logging the change in the same
+    transaction. Returns the removed (name, tier, type), or None if the
+    tank does not exist.
+    """
     async with _connect_db() as db:
+        rows = await db.execute_fetchall(
+            """
+            SELECT t.name, t.tier, t.type,
+                   EXISTS (SELECT 1 FROM submissions s WHERE s.tank_name = t.name)
+            FROM tanks t
+            WHERE t.name_norm = ?
+            """,
+            (utils.norm_tank_name(name),),
+        )
+        if not rows:
+            return None
+        canonical_name, tier, ttype, has_submissions = rows[0]
+        canonical_name = str(canonical_name)
+        if has_submissions:
+            raise ValueError("Tank has submissions and cannot be removed.")
         await db.execute("DELETE FROM tanks WHERE name_norm = ?", (utils.norm_tank_name(canonical_name),))
+        await db.execute(
+            "INSERT INTO tank_changes (action, details, actor, created_at) VALUES (?,?,?,?)",
+            ("remove", canonical_name, actor, created_at),
+        )
         await db.commit()
-    await log_tank_change("remove", canonical_name, actor, created_at)
+    _invalidate_name_caches()
+    return canonical_name, int(tier), str(ttype)
 
 async def merge_tank_into(
     source_name: str,
@@ -2301,6 +2609,7 @@ async def merge_tank_into(
             (utils.norm_tank_name(src_name), src_name, dst_name, created_at),
         )
         await conn.commit()
+    _invalidate_name_caches()
 
     await log_tank_change(
         "merge",
@@ -2310,7 +2619,11 @@ async def merge_tank_into(
     )
     return {
         "source": src_name,
+        "source_tier": src_tier,
+        "source_type": src_type,
         "target": dst_name,
+        "target_tier": dst_tier,
+        "target_type": dst_type,
         "moved": moved,
         "deleted": deleted,
         "upgraded": upgraded,
@@ -2346,8 +2659,8 @@ async def get_champion_filtered(tier: int | None = None, ttype: str | None = Non
         q += " WHERE " + " AND ".join(wh)
     q += " ORDER BY s.score DESC, s.id ASC LIMIT 1;"
     async with _connect_db() as db:
-        cur = await db.execute(q, tuple(args))
-        return await cur.fetchone()
+        rows = await db.execute_fetchall(q, tuple(args))
+        return rows[0] if rows else None
 
 async def best_per_tank_for_bucket(tier: int, type_: str):
     sql = """
@@ -2500,6 +2813,46 @@ async def get_tank_canonical(tank_input: str):
         return (str(row["name"]), int(row["tier"]), str(row["type"]))
     return None
 
+async def get_tanks_canonical_bulk(tank_inputs: list[str]) -> dict[str, tuple[str, int, str]]:
+    """Batch get_tank_canonical: map each resolvable input to (canonical_name, tier, type)."""
+    by_norm: dict[str, list[str]] = {}
+    for tank_input in tank_inputs:
+        by_norm.setdefault(utils.norm_tank_name(tank_input), []).append(tank_input)
+    found: dict[str, tuple[str, int, str]] = {}
+    norms = list(by_norm)
+    async with _connect_db() as conn:
+        for i in range(0, len(norms), 500):
+            chunk = norms[i:i + 500]
+            marks = ",".join("?" * len(chunk))
+            rows = await conn.execute_fetchall(
+                f"SELECT name_norm, name, tier, type FROM tanks WHERE name_norm IN ({marks})",
+                tuple(chunk),
+            )
+            for norm, name, tier, ttype in rows:
+                found[norm] = (str(name), int(tier), str(ttype))
+        # alias fallback for inputs that are not canonical names
+        missing = [n for n in norms if n not in found]
+        for i in range(0, len(missing), 500):
+            chunk = missing[i:i + 500]
+            marks = ",".join("?" * len(chunk))
+            rows = await conn.execute_fetchall(
+                f"""
+                SELECT a.alias_norm, t.name, t.tier, t.type
+                FROM tank_aliases a
+                JOIN tanks t ON t.name = a.tank_name
+                WHERE a.alias_norm IN ({marks})
+                """,
+                tuple(chunk),
+            )
+            for norm, name, tier, ttype in rows:
+                found.setdefault(norm, (str(name), int(tier), str(ttype)))
+    return {
+        tank_input: found[norm]
+        for norm, inputs in by_norm.items()
+        if norm in found
+        for tank_input in inputs
+    }
+
 
 async def get_submission_by_id(submission_id: int):
     async with _connect_db() as db:
@@ -2527,9 +2880,10 @@ async def edit_submission_score(
     async with _connect_db() as conn:
         cur = await conn.execute(
             """
-            SELECT id, player_name_raw, player_name_norm, tank_name, score
-            FROM submissions
-            WHERE id = ?
+            SELECT s.id, s.player_name_raw, s.player_name_norm, s.tank_name, s.score, t.tier, t.type
+            FROM submissions s
+            LEFT JOIN tanks t ON t.name = s.tank_name
+            WHERE s.id = ?
             LIMIT 1
             """,
             (int(submission_id),),
@@ -2544,6 +2898,8 @@ async def edit_submission_score(
         old_player_norm = str(row[2])
         tank_name = str(row[3])
         old_score = int(row[4])
+        tier = int(row[5]) if row[5] is not None else None
+        ttype = str(row[6]) if row[6] is not None else None
         player_raw = str(new_player_raw) if new_player_raw is not None else old_player_raw
         player_norm = str(new_player_norm) if new_player_norm is not None else old_player_norm
         score_to_set = int(new_score) if new_score is not None else old_score
@@ -2554,6 +2910,8 @@ async def edit_submission_score(
             return {
                 "id": sid,
                 "tank_name": tank_name,
+                "tier": tier,
+                "ttype": ttype,
                 "old_player_raw": old_player_raw,
                 "new_player_raw": player_raw,
                 "old_score": old_score,
@@ -2597,6 +2955,8 @@ async def edit_submission_score(
     return {
         "id": sid,
         "tank_name": tank_name,
+        "tier": tier,
+        "ttype": ttype,
         "old_player_raw": old_player_raw,
         "new_player_raw": player_raw,
         "old_score": old_score,
@@ -2610,9 +2970,10 @@ async def delete_submission(submission_id: int, actor: str, created_at: str, har
     async with _connect_db() as conn:
         cur = await conn.execute(
             """
-            SELECT id, player_name_raw, player_name_norm, tank_name, score
-            FROM submissions
-            WHERE id = ?
+            SELECT s.id, s.player_name_raw, s.player_name_norm, s.tank_name, s.score, t.tier, t.type
+            FROM submissions s
+            LEFT JOIN tanks t ON t.name = s.tank_name
+            WHERE s.id = ?
             LIMIT 1
             """,
             (int(submission_id),),
@@ -2627,6 +2988,8 @@ async def delete_submission(submission_id: int, actor: str, created_at: str, har
         player_norm = str(row[2])
         tank_name = str(row[3])
         old_score = int(row[4])
+        tier = int(row[5]) if row[5] is not None else None
+        ttype = str(row[6]) if row[6] is not None else None
 
         new_score: int | None = None
         details = "manual-delete-revert"
@@ -2677,6 +3040,8 @@ async def delete_submission(submission_id: int, actor: str, created_at: str, har
     return {
         "id": sid,
         "tank_name": tank_name,
+        "tier": tier,
+        "ttype": ttype,
         "old_score": old_score,
         "new_score": (None if hard_delete else int(new_score or 0)),
         "hard_delete": bool(hard_delete),
@@ -2696,10 +3061,12 @@ async def score_changes(limit: int = 25):
         )
         return await cur.fetchall()
 
-async def insert_submissions_bulk(rows):
+async def insert_submissions_bulk(rows, *, on_progress=None):
     """
     rows: list of tuples
       (player_raw, player_norm, tank_name, score, submitted_by, created_at)
+    on_progress: optional coroutine function called as (done, total) after
+      each committed chunk.
     Returns: dict with attempted/added/updated/ignored counters.
     """
     if not rows:
@@ -2708,74 +3075,110 @@ async def insert_submissions_bulk(rows):
     updated = 0
     ignored = 0
     async with _connect_db() as conn:
-        for player_raw, player_norm, tank_name, score, submitted_by, created_at in rows:
-            cur = await conn.execute(
-                """
-                SELECT id, score, player_name_raw
-                FROM submissions
-                WHERE tank_name = ? AND player_name_norm = ?
-                LIMIT 1
-                """,
-                (tank_name, player_norm),
-            )
-            existing = await cur.fetchone()
-            await cur.close()
+        # One short write transaction per chunk so /submit is not starved
+        # while a large import holds the SQLite write lock.
+        chunk_size = config.IMPORT_COMMIT_ROWS
+        for start in range(0, len(rows), chunk_size):
+            await conn.execute("BEGIN IMMEDIATE")
+            try:
+                counts = await _insert_submissions_chunk(conn, rows[start:start + chunk_size])
+                await conn.commit()
+            except Exception:
+                await conn.rollback()
+                raise
+            added += counts[0]
+            updated += counts[1]
+            ignored += counts[2]
+            if on_progress is not None:
+                await on_progress(min(start + chunk_size, len(rows)), len(rows))
 
-            if existing is None:
-                cur = await conn.execute(
-                    """
-                    INSERT INTO submissions (
-                        player_name_raw, player_name_norm, tank_name, score, submitted_by, created_at
-                    )
-                    VALUES (?, ?, ?, ?, ?, ?)
-                    """,
-                    (player_raw, player_norm, tank_name, score, submitted_by, created_at),
-                )
-                submission_id = int(cur.lastrowid)
-                await _log_score_change_conn(
-                    conn,
-                    action="add",
-                    submission_id=submission_id,
-                    tank_name=tank_name,
-                    player_name_raw=player_raw,
-                    player_name_norm=player_norm,
-                    old_score=None,
-                    new_score=int(score),
-                    actor=submitted_by,
-                    created_at=created_at,
-                    details="bulk-import",
-                )
-                added += 1
-                continue
+    return {"attempted": len(rows), "added": added, "updated": updated, "ignored": ignored}
 
-            submission_id, existing_score, _existing_player_raw = int(existing[0]), int(existing[1]), str(existing[2])
-            if int(score) <= existing_score:
-                ignored += 1
-                continue
+async def _insert_submissions_chunk(conn: aiosqlite.Connection, rows) -> tuple[int, int, int]:
+    added = 0
+    updated = 0
+    ignored = 0
+    # Stage the chunk's (tank, player) keys and resolve existing rows with a
+    # single indexed join instead of one SELECT per imported row.
+    await conn.execute(
+        "CREATE TEMP TABLE IF NOT EXISTS _import_keys (tank_name TEXT NOT NULL, player_name_norm TEXT NOT NULL)"
+    )
+    await conn.execute("DELETE FROM _import_keys")
+    await conn.executemany(
+        "INSERT INTO _import_keys (tank_name, player_name_norm) VALUES (?, ?)",
+        {(r[2], r[1]) for r in rows},
+    )
+    existing_by_key: dict[tuple[str, str], tuple[int, int]] = {
+        (str(tank_name), str(player_norm)): (int(sid), int(score))
+        for tank_name, player_norm, sid, score in await conn.execute_fetchall(
+            """
+            SELECT s.tank_name, s.player_name_norm, s.id, s.score
+            FROM _import_keys k
+            JOIN submissions s
+              ON s.tank_name = k.tank_name AND s.player_name_norm = k.player_name_norm
+            """
+        )
+    }
+    await conn.execute("DELETE FROM _import_keys")
 
-            await conn.execute(
+    # Score updates and audit rows don't need per-row results, so they are
+    # collected and written with one executemany each at the end.
+    update_rows: list[tuple] = []
+    change_rows: list[tuple] = []
+
+    for player_raw, player_norm, tank_name, score, submitted_by, created_at in rows:
+        existing = existing_by_key.get((tank_name, player_norm))
+
+        if existing is None:
+            cur = await conn.execute(
                 """
-                UPDATE submissions
-                SET player_name_raw = ?, score = ?, submitted_by = ?, created_at = ?
-                WHERE id = ?
+                INSERT INTO submissions (
+                    player_name_raw, player_name_norm, tank_name, score, submitted_by, created_at
+                )
+                VALUES (?, ?, ?, ?, ?, ?)
                 """,
-                (player_raw, int(score), submitted_by, created_at, submission_id),
-            )
-            await _log_score_change_conn(
-                conn,
-                action="edit",
-                submission_id=submission_id,
-                tank_name=tank_name,
-                player_name_raw=player_raw,
-                player_name_norm=player_norm,
-                old_score=existing_score,
-                new_score=int(score),
-                actor=submitted_by,
-                created_at=created_at,
-                details="bulk-import-higher-score",
+                (player_raw, player_norm, tank_name, score, submitted_by, created_at),
             )
-            updated += 1
+            submission_id = int(cur.lastrowid)
+            existing_by_key[(tank_name, player_norm)] = (submission_id, int(score))
+            change_rows.append((
+                "add", submission_id, tank_name, player_raw, player_norm,
+                None, int(score), submitted_by, created_at, "bulk-import",
+            ))
+            added += 1
+            continue
 
-        await conn.commit()
+        submission_id, existing_score = existing
+        if int(score) <= existing_score:
+            ignored += 1
+            continue
+        existing_by_key[(tank_name, player_norm)] = (submission_id, int(score))
 
-    return {"attempted": len(rows), "added": added, "updated": updated, "ignored": ignored}
+        update_rows.append((player_raw, int(score), submitted_by, created_at, submission_id))
+        change_rows.append((
+            "edit", submission_id, tank_name, player_raw, player_norm,
+            existing_score, int(score), submitted_by, created_at, "bulk-import-higher-score",
+        ))
+        updated += 1
+
+    if update_rows:
+        await conn.executemany(
+            """
+            UPDATE submissions
+            SET player_name_raw = ?, score = ?, submitted_by = ?, created_at = ?
+            WHERE id = ?
+            """,
+            update_rows,
+        )
+    if change_rows:
+        await conn.executemany(
+            """
+            INSERT INTO score_changes (
+                action, submission_id, tank_name, player_name_raw, player_name_norm,
+                old_score, new_score, actor, created_at, details
+            )
+            VALUES (?,?,?,?,?,?,?,?,?,?)
+            """,
+            change_rows,
+        )
+    return added, updated, ignored
@@ -1,3 +1,4 @@
+import asyncio
 import discord
 import re
 from datetime import datetime, timezone
@@ -154,10 +155,12 @@ async def upsert_bucket_thread(bot: discord.Client, tier: int, ttype: str):
 
 
 async def _upsert_bucket_forum_thread(bot: discord.Client, tier: int, ttype: str):
-    forum = await _resolve_forum_channel(bot)
-
-    thread_id = await db.get_index_thread_id(tier, ttype)
-    rows = await db.get_bucket_snapshot_rows(tier, ttype)
+    # The channel lookup, thread mapping and snapshot rows are independent.
+    forum, thread_id, rows = await asyncio.gather(
+        _resolve_forum_channel(bot),
+        db.get_index_thread_id(tier, ttype),
+        db.get_bucket_snapshot_rows(tier, ttype),
+    )
     pages = render_bucket_snapshot_pages(tier, ttype, rows)
     if not pages:
         pages = [f"Leaderboard — Tier {tier} / {utils.title_case_type(ttype)}"]
@@ -191,6 +194,42 @@ async def targeted_update(bot: discord.Client, tier: int, ttype: str):
     await upsert_bucket_thread(bot, tier, ttype)
 
 
+async def targeted_update_many(bot: discord.Client, buckets, *, concurrency: int | None = None, on_progress=None):
+    """
+    Refresh several buckets. Forum threads are independent, so they are
+    updated concurrently (bounded by TANK_INDEX_UPDATE_CONCURRENCY unless
+    overridden); the normal channel index posts new messages in channel
+    order, so it is kept sequential.
+    on_progress: optional coroutine function called as (done, total).
+    """
+    ordered = sorted({(int(tier), str(ttype)) for tier, ttype in buckets})
+    total = len(ordered)
+    done = 0
+
+    async def _report():
+        nonlocal done
+        done += 1
+        if on_progress is not None:
+            await on_progress(done, total)
+
+    if _has_normal_index() or total <= 1:
+        for tier, ttype in ordered:
+            await targeted_update(bot, tier, ttype)
+            await _report()
+        return
+
+    if concurrency is None:
+        concurrency = config.TANK_INDEX_UPDATE_CONCURRENCY
+    sem = asyncio.Semaphore(max(1, concurrency))
+
+    async def _one(tier: int, ttype: str):
+        async with sem:
+            await targeted_update(bot, tier, ttype)
+        await _report()
+
+    await asyncio.gather(*(_one(tier, ttype) for tier, ttype in ordered))
+
+
 async def rebuild_all(bot: discord.Client):
     _ensure_index_configured()
 
@@ -1,5 +1,7 @@
+import asyncio
 import discord
 from discord import app_commands
+from discord.ext import tasks
 import importlib
 import inspect
 import logging
@@ -65,6 +67,13 @@ def _instrument_registered_commands(guild: discord.Object | None):
     for command in commands:
         _instrument_command(command)
 
+@tasks.loop(minutes=15)
+async def db_optimize_loop():
+    try:
+        await db.optimize()
+    except Exception:
+        _log.exception("PRAGMA optimize failed")
+
 def _guild_obj():
     return discord.Object(id=config.GUILD_ID) if config.GUILD_ID else None
 
@@ -79,6 +88,8 @@ async def _register_and_sync_commands(*, reload_modules: bool = False):
         _config = importlib.reload(_config)
         _utils = importlib.reload(_utils)
         _forum_index = importlib.reload(_forum_index)
+        # Pooled connections would be orphaned by the reload; close them first.
+        await _db.close_pool()
         _db = importlib.reload(_db)
         _backup = importlib.reload(_backup)
         _wg_sync = importlib.reload(_wg_sync)
@@ -134,6 +145,7 @@ async def reload_runtime() -> tuple[bool, str]:
 async def on_ready():
     logging_setup.setup_logging()
     await db.init_db()
+    await db.warm_pool()
 
     # Start backup scheduler
     if not backup.weekly_backup_loop.is_running():
@@ -142,6 +154,8 @@ async def on_ready():
         wg_sync.daily_clan_sync_loop.start(bot)
     if not tank_name_sync.monthly_tank_sync_loop.is_running():
         tank_name_sync.monthly_tank_sync_loop.start(bot)
+    if not db_optimize_loop.is_running():
+        db_optimize_loop.start()
 
     await _register_and_sync_commands(reload_modules=False)
     await wg_sync.bootstrap_if_needed()
@@ -154,7 +168,21 @@ async def on_ready():
 
     logging.getLogger(__name__).info("Logged in as %s (id=%s)", bot.user, bot.user.id)
 
+def _install_uvloop() -> None:
+    # uvloop is optional; the default asyncio loop is used when it is not installed.
+    try:
+        import uvloop
+    except ImportError:
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    _log.info("Using uvloop event loop")
+
 def run():
     if not config.DISCORD_TOKEN:
         raise RuntimeError("DISCORD_TOKEN is missing")
-    bot.run(config.DISCORD_TOKEN)
+    _install_uvloop()
+    try:
+        bot.run(config.DISCORD_TOKEN)
+    finally:
+        # Idle pooled connections own worker threads; close them so exit is clean.
+        asyncio.run(db.close_pool())
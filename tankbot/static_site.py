@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import asyncio
 from collections import defaultdict
 from datetime import datetime, timezone
 from html import escape
 import json
+import logging
 import os
 from pathlib import Path
 from urllib.parse import quote
@@ -12,6 +14,13 @@ from . import config, db, utils
 
 TYPE_ORDER = {"light": 0, "medium": 1, "heavy": 2, "td": 3}
 
+logger = logging.getLogger(__name__)
+_regen_task: asyncio.Task | None = None
+_regen_pending = False
+# Short settle delay before each background run so a burst of score changes
+# produces a single page build.
+_REGEN_SETTLE_SECONDS = 2.0
+
 
 def _safe_web_text(value: object, *, fallback: str = "—", quote: bool = False) -> str:
     raw = str(value) if value is not None else fallback
@@ -1615,3 +1624,33 @@ async def generate_leaderboard_page() -> str | None:
     output_path.parent.mkdir(parents=True, exist_ok=True)
     output_path.write_text(html, encoding="utf-8")
     return str(output_path)
+
+
+def schedule_leaderboard_page() -> bool:
+    """
+    Regenerate the leaderboard page in the background, after a short settle
+    delay. Requests made while a run is pending or in flight coalesce into
+    at most one follow-up run.
+    Returns False when page generation is disabled.
+    """
+    global _regen_task, _regen_pending
+    if not config.WEB_LEADERBOARD_ENABLED:
+        return False
+    if _regen_task is not None and not _regen_task.done():
+        _regen_pending = True
+        return True
+    _regen_task = asyncio.create_task(_regen_worker())
+    return True
+
+
+async def _regen_worker():
+    global _regen_pending
+    while True:
+        await asyncio.sleep(_REGEN_SETTLE_SECONDS)
+        _regen_pending = False
+        try:
+            await generate_leaderboard_page()
+        except Exception:
+            logger.exception("Failed to update static leaderboard page")
+        if not _regen_pending:
+            return
@@ -1,5 +1,7 @@
+import csv
 import datetime as dt
 import discord
+import io
 import re
 import unicodedata
 from . import config
@@ -7,6 +9,11 @@ from . import config
 from datetime import datetime, timezone
 
 _WS_RE = re.compile(r"\s+")
+_OBJ_ABBREV_RE = re.compile(r"\bobj\.\b|\bobj\b")
+_MLE_WORD_RE = re.compile(r"\bmle\.\b|\bmle\b")
+_NUMBER_WORD_RE = re.compile(r"\bnumber\b")
+_NON_ALNUM_RE = re.compile(r"[^a-z0-9]+")
+_CONTROL_CHAR_RE = re.compile(r"[\x00-\x1f]")
 
 def normalize_tank(name: str) -> str:
     """
@@ -26,7 +33,7 @@ def normalize_tank(name: str) -> str:
 def norm_tank_name(s: str) -> str:
     # case-insensitive, trim, collapse internal whitespace
     s = (s or "").strip().lower()
-    s = re.sub(r"\s+", " ", s)
+    s = _WS_RE.sub(" ", s)
     return s
 
 def loose_tank_key(s: str) -> str:
@@ -41,11 +48,11 @@ def loose_tank_key(s: str) -> str:
     raw = "".join(ch for ch in raw if not unicodedata.combining(ch))
     raw = raw.casefold()
     raw = raw.replace("\u00a0", " ")
-    raw = re.sub(r"\bobj\.\b|\bobj\b", "object", raw)
-    raw = re.sub(r"\bmle\.\b|\bmle\b", " ", raw)
-    raw = re.sub(r"\bnumber\b", " ", raw)
-    raw = re.sub(r"\s+", " ", raw).strip()
-    return re.sub(r"[^a-z0-9]+", "", raw)
+    raw = _OBJ_ABBREV_RE.sub("object", raw)
+    raw = _MLE_WORD_RE.sub(" ", raw)
+    raw = _NUMBER_WORD_RE.sub(" ", raw)
+    raw = _WS_RE.sub(" ", raw).strip()
+    return _NON_ALNUM_RE.sub("", raw)
 
 def fmt_utc(iso: str | None) -> str:
     if not iso:
@@ -67,13 +74,17 @@ def fmt_utc(iso: str | None) -> str:
     dt = dt.astimezone(timezone.utc)
     return dt.strftime("%Y-%m-%d %H:%M")
 
+TANK_TYPES = frozenset(("light", "medium", "heavy", "td"))
+
+_TYPE_TITLES = {
+    "light": "Light",
+    "medium": "Medium",
+    "heavy": "Heavy",
+    "td": "Tank Destroyer",
+}
+
 def title_case_type(t: str) -> str:
-    return {
-        "light": "Light",
-        "medium": "Medium",
-        "heavy": "Heavy",
-        "td": "Tank Destroyer",
-    }.get(t.lower(), t)
+    return _TYPE_TITLES.get(t.lower(), t)
 
 def has_commander_role(member: discord.Member) -> bool:
     if config.COMMANDER_ROLE_ID > 0:
@@ -99,12 +110,12 @@ def validate_text(label: str, value: str, max_len: int = 64) -> str:
         raise ValueError(f"{label} is required.")
     if len(v) > max_len:
         raise ValueError(f"{label} is too long (max {max_len} chars).")
-    # Disallow newlines and control characters
-    for ch in v:
-        if ch in ("\n", "\r", "\t"):
+    # Disallow newlines and control characters (the first offender decides the message)
+    m = _CONTROL_CHAR_RE.search(v)
+    if m:
+        if m.group() in ("\n", "\r", "\t"):
             raise ValueError(f"{label} must be a single line.")
-        if ord(ch) < 32:
-            raise ValueError(f"{label} contains invalid control characters.")
+        raise ValueError(f"{label} contains invalid control characters.")
     return v
 
 def clip(s: str | None, n: int) -> str:
@@ -156,3 +167,50 @@ def fmt_table(rows: list[list[str]], widths: list[int]) -> str:
                 cells.append(s.ljust(w))
         out.append("  ".join(cells).rstrip())
     return "\n".join(out)
+
+def csv_upload_error(size: int) -> str | None:
+    """Reply for an empty or oversized CSV attachment, or None if it may be read."""
+    if not size:
+        return "CSV file is empty."
+    if size > config.IMPORT_MAX_CSV_BYTES:
+        return f"CSV too large: {size} bytes (limit {config.IMPORT_MAX_CSV_BYTES} bytes). Split your CSV."
+    return None
+
+class CsvUpload:
+    """
+    An uploaded CSV, decoded lazily while csv parses (no full str copy), with
+    its header mapped once. column() falls back to a blank pad cell one past
+    the header, and rows() pads every row to reach it, so callers index rows
+    directly instead of bounds-checking each cell.
+    """
+
+    def __init__(self, data: bytes):
+        self._reader = csv.reader(
+            io.TextIOWrapper(io.BytesIO(data), encoding="utf-8-sig", errors="replace", newline="")
+        )
+        self.header = next(self._reader, None) or []
+        self._idx = {h.strip().lower(): i for i, h in enumerate(self.header)}
+        self._width = len(self.header) + 1
+
+    def column(self, *names: str) -> int:
+        """Index of the first header matching one of names (lowercase), else the pad cell."""
+        for name in names:
+            i = self._idx.get(name)
+            if i is not None:
+                return i
+        return len(self.header)
+
+    def rows(self):
+        """Yield (line_number, padded_row) for non-blank rows; the header is line 1."""
+        width = self._width
+        for line, row in enumerate(self._reader, start=2):
+            if not row:
+                continue
+            if len(row) < width:
+                row += [""] * (width - len(row))
+            yield line, row
+
+    @property
+    def line_num(self) -> int:
+        """Lines read from the file so far."""
+        return self._reader.line_num